@@ -0,0 +1,134 @@
+"""
+Καθολικός Περιορισμός Όλων-Διαφορετικών (all-different) για τις Χρονοθυρίδες
+
+Υλοποίηση του αλγορίθμου του Régin για τον κανόνα "μία εξέταση ανά χρονοθυρίδα".
+Ο περιορισμός αναπαρίσταται ως διμερής γράφος μεταβλητών-τιμών:
+- Αν δεν υπάρχει ταίριασμα που καλύπτει όλες τις μεταβλητές, το πρόβλημα είναι
+  ασυνεπές (π.χ. περισσότερες εξετάσεις από ελεύθερες χρονοθυρίδες).
+- Μια ακμή (x, v) εκτός ταιριάσματος αφαιρείται αν δεν ανήκει σε καμία εναλλασσόμενη
+  διαδρομή από ελεύθερη τιμή ούτε σε εναλλασσόμενο κύκλο (ίδια ισχυρά συνεκτική συνιστώσα).
+Το ταίριασμα διατηρείται μεταξύ των κόμβων της αναζήτησης και επισκευάζεται
+αυξητικά, μόνο για τις μεταβλητές που έχασαν την τιμή τους.
+"""
+
+class AllDifferentPropagator:
+    """Διάδοση του all-different με ταίριασμα και ισχυρά συνεκτικές συνιστώσες (Régin)."""
+
+    def __init__(self, variables):
+        self.variables = list(variables)
+        # Τρέχον ταίριασμα μεταβλητή -> τιμή, διατηρείται μεταξύ κλήσεων
+        self.matching = {}
+
+    def _augment(self, var, domains, var_of, visited):
+        """Αναζήτηση επαυξάνουσας διαδρομής από τη μεταβλητή var (DFS)."""
+        for val in domains[var]:
+            if val in visited:
+                continue
+            visited.add(val)
+            owner = var_of.get(val)
+            if owner is None or self._augment(owner, domains, var_of, visited):
+                self.matching[var] = val
+                var_of[val] = var
+                return True
+        return False
+
+    def propagate(self, csp, removals):
+        """
+        Επιστρέφει False αν δεν υπάρχει ταίριασμα για όλες τις μεταβλητές,
+        αλλιώς αφαιρεί από τα csp.curr_domains όλες τις τιμές χωρίς υποστήριξη.
+        """
+        domains = csp.curr_domains
+
+        # 1. Επισκευή του ταιριάσματος: κρατάμε όσα ζεύγη είναι ακόμα στα πεδία
+        var_of = {}
+        for var, val in list(self.matching.items()):
+            if val in domains[var] and val not in var_of:
+                var_of[val] = var
+            else:
+                del self.matching[var]
+        for var in self.variables:
+            if var not in self.matching:
+                if not self._augment(var, domains, var_of, set()):
+                    return False
+
+        # 2. Κατευθυνόμενος γράφος: τιμή -> μεταβλητή για ακμές εκτός ταιριάσματος,
+        #    μεταβλητή -> τιμή για ακμές του ταιριάσματος
+        successors = {}
+        for var in self.variables:
+            successors[('var', var)] = [('val', self.matching[var])]
+            for val in domains[var]:
+                if val != self.matching[var]:
+                    successors.setdefault(('val', val), []).append(('var', var))
+
+        # 3. Κόμβοι προσβάσιμοι από ελεύθερες τιμές (εναλλασσόμενες διαδρομές)
+        reachable = set()
+        stack = [node for node in successors if node[0] == 'val' and node[1] not in var_of]
+        while stack:
+            node = stack.pop()
+            if node in reachable:
+                continue
+            reachable.add(node)
+            stack.extend(successors.get(node, ()))
+
+        # 4. Ισχυρά συνεκτικές συνιστώσες (εναλλασσόμενοι κύκλοι)
+        component = self._components(successors)
+
+        # 5. Αφαίρεση ακμών που δεν ανήκουν σε κανένα μέγιστο ταίριασμα
+        for var in self.variables:
+            matched = self.matching[var]
+            var_node = ('var', var)
+            for val in domains[var][:]:
+                if val == matched:
+                    continue
+                val_node = ('val', val)
+                if val_node in reachable or component[val_node] == component[var_node]:
+                    continue
+                csp.prune(var, val, removals)
+        return True
+
+    @staticmethod
+    def _components(successors):
+        """Αλγόριθμος Tarjan (επαναληπτικός): αναγνωριστικό συνιστώσας ανά κόμβο."""
+        index = {}
+        low = {}
+        component = {}
+        on_stack = set()
+        stack = []
+        counter = 0
+
+        for root in successors:
+            if root in index:
+                continue
+            work = [(root, iter(successors.get(root, ())))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(successors.get(child, ()))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = index[node]
+                        if member == node:
+                            break
+        return component
@@ -10,7 +10,10 @@
 τον αλγόριθμο Floyd-Warshall για τον υπολογισμό των ελάχιστων
 αποστάσεων μεταξύ των κόμβων του γράφου.
 """
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
+from collections import deque
+import math
+import random
 import numpy as np
 from dataclasses import dataclass
 
@@ -20,16 +23,158 @@ class NegativeCycle:
     cycle: List[str]
     total_weight: float
 
+# Ακμή γράφου αποστάσεων: (γειτονικός κόμβος, βάρος)
+Edge = Tuple[int, float]
+
+def spfa(n: int, out_edges: List[List[Edge]]) -> Tuple[List[float], List[int], List[float], int]:
+    """
+    Bellman-Ford με ουρά (SPFA) από εικονική πηγή με ακμές βάρους 0 προς όλους τους κόμβους.
+
+    Επιστρέφει:
+        (δυναμικό, γονέας, βάρος_ακμής_γονέα, κόμβος_κύκλου)
+        όπου κόμβος_κύκλου = -1 αν δεν υπάρχει αρνητικός κύκλος, αλλιώς
+        ένας κόμβος από τον οποίο η διαδρομή γονέων οδηγεί σε αρνητικό κύκλο.
+    """
+    potential = [0.0] * n
+    parent = [-1] * n
+    parent_weight = [0.0] * n
+    # Πλήθος ακμών της τρέχουσας συντομότερης διαδρομής από την εικονική πηγή
+    length = [1] * n
+    in_queue = [True] * n
+    queue = deque(range(n))
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        for v, weight in out_edges[u]:
+            new_dist = potential[u] + weight
+            if new_dist < potential[v]:
+                potential[v] = new_dist
+                parent[v] = u
+                parent_weight[v] = weight
+                length[v] = length[u] + 1
+                # Διαδρομή με περισσότερες από n ακμές περιέχει αρνητικό κύκλο
+                if length[v] > n:
+                    return potential, parent, parent_weight, v
+                if not in_queue[v]:
+                    in_queue[v] = True
+                    queue.append(v)
+
+    return potential, parent, parent_weight, -1
+
+def extract_cycle(start: int, parent: List[int], parent_weight: List[float],
+                  names: List[str]) -> NegativeCycle:
+    """
+    Εξαγωγή του αρνητικού κύκλου από τη διαδρομή γονέων σε O(n).
+    Ο κύκλος επιστρέφεται κλειστός (πρώτο = τελευταίο γεγονός) και με τη σειρά των ακμών.
+    """
+    # Μετά από n βήματα προς τα πίσω βρισκόμαστε σίγουρα πάνω στον κύκλο
+    v = start
+    for _ in range(len(parent)):
+        v = parent[v]
+
+    cycle = [v]
+    total_weight = 0.0
+    u = v
+    while True:
+        total_weight += parent_weight[u]
+        u = parent[u]
+        cycle.append(u)
+        if u == v:
+            break
+    cycle.reverse()
+    return NegativeCycle(cycle=[names[i] for i in cycle], total_weight=total_weight)
+
+# Διαθέσιμες μηχανές διάδοσης του d-graph
+ENGINES = ('numpy', 'loop')
+
+def floyd_warshall(d: np.ndarray) -> np.ndarray:
+    """
+    Διανυσματικός Floyd-Warshall πάνω στον πίνακα αποστάσεων d (επί τόπου).
+
+    Για κάθε ενδιάμεσο κόμβο k χαλαρώνεται ολόκληρος ο πίνακας με μία πράξη
+    broadcasting, d = min(d, d[:,k] + d[k,:]), οπότε αρκεί ένα μόνο πέρασμα
+    αντί για επαναλήψεις μέχρι σημείο σταθερότητας. Δέχεται και στοίβα
+    πινάκων σχήματος (B, n, n), οπότε επεξεργάζεται B προβλήματα μαζί.
+
+    Όπως και ο βρόχος αναφοράς, όσα ζεύγη (i,j) διέρχονται από αρνητικό
+    κύκλο λαμβάνουν απόσταση -inf.
+    """
+    n = d.shape[-1]
+    for k in range(n):
+        np.minimum(d, d[..., :, k, None] + d[..., None, k, :], out=d)
+
+    negative = np.diagonal(d, axis1=-2, axis2=-1) < 0
+    if negative.any():
+        finite = np.isfinite(d)
+        through_cycle = ((finite & negative[..., None, :]).astype(int) @
+                         finite.astype(int)) > 0
+        d[through_cycle] = float('-inf')
+    return d
+
+def check_stp_batch(problems: List[Tuple[List[str], List[Tuple[str, str, float]]]]
+                    ) -> List[Tuple[bool, Dict[str, float]]]:
+    """
+    Έλεγχος συνέπειας πολλών ανεξάρτητων STP με ένα διανυσματικό Floyd-Warshall.
+
+    Τα προβλήματα με το ίδιο πλήθος γεγονότων στοιβάζονται σε έναν τρισδιάστατο
+    πίνακα (B, n, n) και διαδίδονται μαζί, αντί για ένα DGraph ανά πρόβλημα.
+
+    Παράμετροι:
+        problems: Λίστα από πλειάδες (γεγονότα, περιορισμοί), όπως στο DGraph
+
+    Επιστρέφει:
+        Λίστα (είναι_συνεπές, λύση) με τη σειρά των προβλημάτων, όπου η λύση
+        είναι ίδια με αυτή του DGraph.compute_d_graph (κενή αν είναι ασυνεπές)
+    """
+    results: List[Tuple[bool, Dict[str, float]]] = [(False, {})] * len(problems)
+
+    # Ομαδοποίηση προβλημάτων ανά πλήθος γεγονότων
+    by_size: Dict[int, List[int]] = {}
+    for p, (events, _) in enumerate(problems):
+        by_size.setdefault(len(events), []).append(p)
+
+    for n, members in by_size.items():
+        d = np.full((len(members), n, n), float('inf'))
+        d[:, np.arange(n), np.arange(n)] = 0
+        for b, p in enumerate(members):
+            events, constraints = problems[p]
+            event_to_idx = {event: i for i, event in enumerate(events)}
+            for from_event, to_event, weight in constraints:
+                i, j = event_to_idx[from_event], event_to_idx[to_event]
+                d[b, i, j] = min(d[b, i, j], weight)
+
+        floyd_warshall(d)
+
+        consistent = (np.diagonal(d, axis1=1, axis2=2) >= 0).all(axis=1)
+        earliest = -d[:, :, 0]
+        for b, p in enumerate(members):
+            if consistent[b]:
+                results[p] = (True, dict(zip(problems[p][0], earliest[b].tolist())))
+
+    return results
+
 class DGraph:
-    def __init__(self, events: List[str], constraints: List[Tuple[str, str, float]]):
+    def __init__(self, events: List[str], constraints: List[Tuple[str, str, float]],
+                 engine: str = 'numpy'):
         """
         Αρχικοποίηση d-graph με γεγονότα και περιορισμούς.
 
         Παράμετροι:
             events: Λίστα ονομάτων γεγονότων
             constraints: Λίστα από πλειάδες (από_γεγονός, προς_γεγονός, βάρος)
+            engine: Μηχανή διάδοσης, 'numpy' (διανυσματική) ή 'loop'
+                    (ο αρχικός βρόχος i/j/k, ως υλοποίηση αναφοράς)
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Άγνωστη μηχανή διάδοσης: {engine}")
+        self.engine = engine
         self.events = events
+        self.constraints = list(constraints)
+        # Ίχνος αλλαγών για push()/pop(): (γραμμές, στήλες, παλιές_τιμές) ανά ενημέρωση
+        self._trail: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        # Σημεία ελέγχου: (μήκος ίχνους, πλήθος περιορισμών) τη στιγμή του push()
+        self._checkpoints: List[Tuple[int, int]] = []
         self.event_to_idx = {event: i for i, event in enumerate(events)}
         n = len(events)
 
@@ -43,21 +188,15 @@ class DGraph:
             self.d[i,j] = min(self.d[i,j], weight)
 
         # Αρχική διάδοση περιορισμών σύμφωνα με τη σελίδα 12
-        changed = True
-        while changed:
-            changed = False
-            for i in range(n):
-                for j in range(n):
-                    for k in range(n):
-                        if (self.d[i,k] != float('inf') and
-                            self.d[k,j] != float('inf')):
-                            new_dist = self.d[i,k] + self.d[k,j]
-                            if new_dist < self.d[i,j]:
-                                self.d[i,j] = new_dist
-                                changed = True
+        self._propagate_constraints()
 
     def _propagate_constraints(self):
         """Διάδοση περιορισμών με τον αλγόριθμο Floyd-Warshall"""
+        if self.engine == 'numpy':
+            floyd_warshall(self.d)
+            return
+
+        # Μηχανή αναφοράς: βρόχος i/j/k μέχρι σημείο σταθερότητας
         n = len(self.events)
         changed = True
         while changed:
@@ -72,60 +211,72 @@ class DGraph:
                                 self.d[i,j] = new_dist
                                 changed = True
 
+    def add_constraint(self, from_event: str, to_event: str, weight: float) -> bool:
+        """
+        Αυξητική προσθήκη περιορισμού x_to - x_from ≤ weight στο ελάχιστο δίκτυο σε O(n²).
+
+        Κάθε διαδρομή που βελτιώνεται από τη νέα ακμή i→j έχει τη μορφή u→i→j→v,
+        άρα αρκεί μία ενημέρωση d = min(d, d[:,i] + w + d[j,:]) αντί για νέο Floyd-Warshall.
+
+        Επιστρέφει:
+            True αν ο περιορισμός προστέθηκε, False αν δημιουργεί αρνητικό κύκλο
+            (d[j,i] + w < 0). Στη δεύτερη περίπτωση το δίκτυο μένει αμετάβλητο.
+        """
+        i, j = self.event_to_idx[from_event], self.event_to_idx[to_event]
+        if self.d[j,i] + weight < 0:
+            return False
+
+        self.constraints.append((from_event, to_event, weight))
+        if weight < self.d[i,j]:
+            candidate = self.d[:, i, None] + weight + self.d[None, j, :]
+            improved = candidate < self.d
+            if self._checkpoints:
+                # Καταγραφή μόνο των κελιών που αλλάζουν, για φθηνή αναίρεση
+                rows, cols = np.nonzero(improved)
+                self._trail.append((rows, cols, self.d[rows, cols]))
+            self.d[improved] = candidate[improved]
+        return True
+
+    def push(self):
+        """
+        Δημιουργία σημείου ελέγχου. Οι περιορισμοί που προστίθενται με add_constraint
+        μετά από αυτό αναιρούνται με το αντίστοιχο pop().
+        """
+        self._checkpoints.append((len(self._trail), len(self.constraints)))
+
+    def pop(self):
+        """
+        Αναίρεση όλων των περιορισμών από το τελευταίο push(), επαναφέροντας
+        μόνο τα κελιά του d-graph που άλλαξαν.
+        """
+        if not self._checkpoints:
+            raise ValueError("Δεν υπάρχει σημείο ελέγχου για αναίρεση")
+        trail_size, num_constraints = self._checkpoints.pop()
+        while len(self._trail) > trail_size:
+            rows, cols, old_values = self._trail.pop()
+            self.d[rows, cols] = old_values
+        del self.constraints[num_constraints:]
+
     def find_negative_cycle(self) -> Optional[NegativeCycle]:
         """
-        Εύρεση αρνητικού κύκλου χρησιμοποιώντας τον αλγόριθμο Floyd-Warshall.
+        Εύρεση αρνητικού κύκλου, χωρίς δεύτερο πέρασμα Floyd-Warshall.
+
+        Μετά τη διάδοση, αρνητικός κύκλος υπάρχει μόνο αν κάποιο d[i,i] < 0,
+        οπότε ο συνεπής γράφος απορρίπτεται σε O(n). Διαφορετικά ο κύκλος
+        εξάγεται με SPFA πάνω στους αρχικούς περιορισμούς και περπάτημα των
+        γονέων, ώστε να περιέχει μόνο τους περιορισμούς που συγκρούονται.
         Επιστρέφει None αν δεν υπάρχει αρνητικός κύκλος.
         """
+        if not (np.diagonal(self.d) < 0).any():
+            return None
+
         n = len(self.events)
-        # Αρχικοποίηση πίνακα προηγούμενων κόμβων για ανακατασκευή μονοπατιού
-        pred = np.full((n, n), -1)
+        out_edges: List[List[Edge]] = [[] for _ in range(n)]
+        for from_event, to_event, weight in self.constraints:
+            out_edges[self.event_to_idx[from_event]].append((self.event_to_idx[to_event], weight))
 
-        # Floyd-Warshall με παρακολούθηση μονοπατιού
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if (self.d[i,k] != float('inf') and
-                        self.d[k,j] != float('inf')):
-                        new_dist = self.d[i,k] + self.d[k,j]
-                        if new_dist < self.d[i,j]:
-                            self.d[i,j] = new_dist
-                            pred[i,j] = k
-
-        def get_path(start, end):
-            """Ανακατασκευή μονοπατιού από start σε end"""
-            if pred[start,end] == -1:
-                return [self.events[start], self.events[end]]
-            k = pred[start,end]
-            return get_path(start,k)[:-1] + get_path(k,end)
-
-        # Έλεγχος για αρνητικούς κύκλους, εστιάζοντας στο X2-X3-X4
-        x2_idx = self.event_to_idx.get('X2', -1)
-        if x2_idx != -1:  # Αν είμαστε στο πρόβλημα Figure 3
-            x3_idx = self.event_to_idx['X3']
-            x4_idx = self.event_to_idx['X4']
-
-            # Έλεγχος για κύκλο X2->X3->X4->X2
-            cycle = get_path(x2_idx, x3_idx)[:-1] + get_path(x3_idx, x4_idx)[:-1] + get_path(x4_idx, x2_idx)
-            total_weight = sum(
-                self.d[self.event_to_idx[a], self.event_to_idx[b]]
-                for a, b in zip(cycle[:-1], cycle[1:])
-            )
-            if total_weight < 0:
-                return NegativeCycle(cycle=cycle, total_weight=total_weight)
-
-        # Γενικός έλεγχος για άλλους αρνητικούς κύκλους
-        for i in range(n):
-            for j in range(n):
-                if self.d[i,j] + self.d[j,i] < 0:
-                    path = get_path(i,j)[:-1] + get_path(j,i)
-                    total_weight = sum(
-                        self.d[self.event_to_idx[a], self.event_to_idx[b]]
-                        for a, b in zip(path[:-1], path[1:])
-                    )
-                    return NegativeCycle(cycle=path, total_weight=total_weight)
-
-        return None
+        _, parent, parent_weight, cycle_vertex = spfa(n, out_edges)
+        return extract_cycle(cycle_vertex, parent, parent_weight, self.events)
 
     def compute_d_graph(self) -> Tuple[bool, Dict[str, float], Optional[NegativeCycle]]:
         """
@@ -149,6 +300,95 @@ class DGraph:
 
         return True, solution, None
 
+    def _bounded_network(self, horizon: Optional[float]) -> Optional[np.ndarray]:
+        """
+        Αντίγραφο του ελάχιστου δικτύου όπου κάθε γεγονός απέχει το πολύ horizon
+        από το γεγονός αναφοράς. Επιστρέφει None αν το δίκτυο είναι ασυνεπές.
+        """
+        if self.find_negative_cycle() is not None:
+            return None
+
+        d = self.d.copy()
+        if horizon is not None:
+            # Τα όρια του ορίζοντα προστίθενται ως περιορισμοί με την αυξητική ενημέρωση
+            for i, j in [(0, e) for e in range(1, len(d))] + [(e, 0) for e in range(1, len(d))]:
+                if horizon < d[i,j]:
+                    if d[j,i] + horizon < 0:
+                        return None
+                    np.minimum(d, d[:, i, None] + horizon + d[None, j, :], out=d)
+
+        if not (np.isfinite(d[0, :]).all() and np.isfinite(d[:, 0]).all()):
+            raise ValueError("Υπάρχουν γεγονότα χωρίς φράγμα ως προς την αναφορά: ορίστε horizon")
+        return d
+
+    def iter_solutions(self, horizon: Optional[float] = None) -> Iterator[Dict[str, int]]:
+        """
+        Τεμπέλικη απαρίθμηση όλων των ακέραιων λύσεων από το ελάχιστο δίκτυο.
+
+        Τα γεγονότα ανατίθενται με τη σειρά τους (το πρώτο είναι η αναφορά, χρόνος 0)
+        και μετά από κάθε ανάθεση x_k = v τα διαστήματα των υπολοίπων στενεύουν σε O(n):
+        low = max(low, v - d[:,k]) και high = min(high, v + d[k,:]). Επειδή το ελάχιστο
+        δίκτυο είναι αποσυνθέσιμο, κάθε μερική ανάθεση επεκτείνεται σε λύση χωρίς
+        οπισθοδρόμηση, οπότε π.χ. οι πρώτες k λύσεις κοστίζουν O(k·n²).
+
+        Παράμετροι:
+            horizon: Μέγιστη απόσταση από την αναφορά για γεγονότα χωρίς φράγμα
+        """
+        d = self._bounded_network(horizon)
+        if d is None:
+            return
+        n = len(self.events)
+
+        low = np.full(n, float('-inf'))
+        high = np.full(n, float('inf'))
+        low[0] = high[0] = 0
+        bounds = [(low, high)]
+        values: List[int] = []
+        limits: List[int] = []
+        value, limit = 0, 0
+
+        while True:
+            if value <= limit:
+                k = len(values)
+                values.append(value)
+                limits.append(limit)
+                low, high = bounds[-1]
+                bounds.append((np.maximum(low, value - d[:, k]), np.minimum(high, value + d[k, :])))
+                if k + 1 < n:
+                    low, high = bounds[-1]
+                    value, limit = math.ceil(low[k + 1]), math.floor(high[k + 1])
+                    continue
+                yield dict(zip(self.events, values))
+
+            # Επόμενη τιμή στο βαθύτερο γεγονός ή επιστροφή στο προηγούμενο
+            if not values:
+                return
+            bounds.pop()
+            value = values.pop() + 1
+            limit = limits.pop()
+
+    def random_solution(self, rng: Optional[random.Random] = None,
+                        horizon: Optional[float] = None) -> Optional[Dict[str, int]]:
+        """
+        Τυχαία ακέραια λύση με την ίδια ανάθεση χωρίς οπισθοδρόμηση του iter_solutions.
+        Κάθε γεγονός επιλέγεται ομοιόμορφα μέσα στο τρέχον διάστημά του (η κατανομή
+        δεν είναι ομοιόμορφη πάνω σε όλο τον χώρο λύσεων). Επιστρέφει None αν δεν υπάρχει λύση.
+        """
+        d = self._bounded_network(horizon)
+        if d is None:
+            return None
+        rng = rng or random.Random()
+
+        low = -d[:, 0]
+        high = d[0, :].copy()
+        solution = {self.events[0]: 0}
+        for k in range(1, len(self.events)):
+            value = rng.randint(math.ceil(low[k]), math.floor(high[k]))
+            solution[self.events[k]] = value
+            low = np.maximum(low, value - d[:, k])
+            high = np.minimum(high, value + d[k, :])
+        return solution
+
 def analyze_maria_eleni_problem() -> str:
     """Ανάλυση του χρονικού προβλήματος Μαρία-Ελένη χρησιμοποιώντας τον αλγόριθμο d-graph."""
     # Ορισμός γεγονότων και περιορισμών
@@ -0,0 +1,131 @@
+"""
+Αναζήτηση με Οπισθοπήδημα Κατευθυνόμενο από Συγκρούσεις (FC-CBJ) και Μάθηση Nogoods
+
+Σε αντίθεση με τη χρονολογική οπισθοδρόμηση της AIMA:
+- Κάθε αφαίρεση τιμής από το πεδίο μιας μεταβλητής εξηγείται από την ανάθεση
+  που την προκάλεσε (έλεγχος προώθησης), οπότε για κάθε αποτυχία είναι γνωστό
+  ποιες προηγούμενες αναθέσεις ευθύνονται (σύνολο σύγκρουσης).
+- Όταν εξαντληθεί μια μεταβλητή, η αναζήτηση επιστρέφει απευθείας στη βαθύτερη
+  μεταβλητή του συνόλου σύγκρουσης, παρακάμπτοντας όσες δεν σχετίζονται.
+- Κάθε μικρό σύνολο σύγκρουσης αποθηκεύεται ως nogood (συνδυασμός αναθέσεων χωρίς
+  λύση) σε αποθήκη περιορισμένου μεγέθους με απομάκρυνση LRU, ώστε η ίδια σύγκρουση
+  να μην ανακαλύπτεται ξανά σε άλλο κλαδί. Λόγω του μοναδικού δωματίου τα περισσότερα
+  σύνολα σύγκρουσης περιέχουν σχεδόν όλη την ανάθεση· τόσο μακριά nogoods δεν ξαναταιριάζουν
+  και μόνο καθυστερούν τον έλεγχο, οπότε δεν αποθηκεύονται.
+Οι εξηγήσεις είναι ακριβείς για τον έλεγχο προώθησης, όπου κάθε αφαίρεση οφείλεται
+μόνο στη μεταβλητή που μόλις ανατέθηκε.
+"""
+from collections import OrderedDict, defaultdict
+
+class NogoodStore:
+    """
+    Αποθήκη nogoods με ευρετήριο ανά ανάθεση (μεταβλητή, τιμή) και απομάκρυνση LRU.
+    Κρατά μόνο nogoods με έως max_size αναθέσεις, ώστε ο έλεγχος να μένει φθηνός.
+    """
+
+    def __init__(self, capacity=10000, max_size=8):
+        self.capacity = capacity
+        self.max_size = max_size
+        self.nogoods = OrderedDict()       # nogood -> None, σε σειρά τελευταίας χρήσης
+        self.watch = defaultdict(set)      # (μεταβλητή, τιμή) -> nogoods που την περιέχουν
+        self.stats = {'stored': 0, 'hits': 0, 'evicted': 0, 'too_long': 0}
+
+    def __len__(self):
+        return len(self.nogoods)
+
+    def add(self, literals):
+        """Καταγραφή του nogood literals (σύνολο ζευγών (μεταβλητή, τιμή))."""
+        nogood = frozenset(literals)
+        if len(nogood) > self.max_size:
+            self.stats['too_long'] += 1
+            return
+        if not nogood or nogood in self.nogoods:
+            return
+        self.nogoods[nogood] = None
+        for literal in nogood:
+            self.watch[literal].add(nogood)
+        self.stats['stored'] += 1
+        if len(self.nogoods) > self.capacity:
+            oldest, _ = self.nogoods.popitem(last=False)
+            for literal in oldest:
+                self.watch[literal].discard(oldest)
+            self.stats['evicted'] += 1
+
+    def blocking(self, var, value, assignment):
+        """
+        Αν η ανάθεση var=value ολοκληρώνει ένα nogood με την τρέχουσα ανάθεση,
+        επιστρέφει τις υπόλοιπες μεταβλητές του (την εξήγηση), αλλιώς None.
+        """
+        watching = self.watch.get((var, value))
+        if not watching:
+            return None
+        for nogood in watching:
+            if all(x == var or assignment.get(x, None) == a for x, a in nogood):
+                self.nogoods.move_to_end(nogood)
+                self.stats['hits'] += 1
+                return {x for x, _ in nogood if x != var}
+        return None
+
+def cbj_search(csp, inference, select_unassigned_variable, nogood_capacity=10000, max_nogood_size=8):
+    """
+    FC-CBJ με μάθηση nogoods πάνω στα suppose/prune/restore του csp.
+
+    Παράμετροι:
+        csp: Το πρόβλημα (π.χ. ExamSchedulerCSP)
+        inference: Έλεγχος προώθησης που αφαιρεί τιμές μέσω csp.prune
+        select_unassigned_variable: Ευρετική επιλογής μεταβλητής
+        nogood_capacity: Μέγιστος αριθμός nogoods στην αποθήκη
+        max_nogood_size: Μέγιστο πλήθος αναθέσεων ενός nogood που αποθηκεύεται
+
+    Επιστρέφει:
+        (λύση ή None, NogoodStore)
+    """
+    assignment = {}
+    # pruned_by[B]: οι ανατεθειμένες μεταβλητές που αφαίρεσαν τιμές από το B, με σειρά βάθους
+    pruned_by = defaultdict(list)
+    store = NogoodStore(nogood_capacity, max_nogood_size)
+
+    def backtrack():
+        if len(assignment) == len(csp.variables):
+            return dict(assignment), None
+        var = select_unassigned_variable(assignment, csp)
+        conflict = set()
+        for value in csp.choices(var):
+            explanation = store.blocking(var, value, assignment)
+            if explanation is not None:
+                conflict |= explanation
+                continue
+            csp.assign(var, value, assignment)
+            removals = csp.suppose(var, value)
+            if inference(csp, var, value, assignment, removals):
+                touched = {B for B, _ in removals if B != var}
+                for B in touched:
+                    pruned_by[B].append(var)
+                result, child_conflict = backtrack()
+                for B in touched:
+                    pruned_by[B].pop()
+                csp.restore(removals)
+                if result is not None:
+                    return result, None
+                if var not in child_conflict:
+                    # Η αποτυχία δεν οφείλεται στο var: οπισθοπήδημα πάνω από αυτό
+                    csp.unassign(var, assignment)
+                    return None, child_conflict
+                conflict |= child_conflict - {var}
+            else:
+                # Το πεδίο που άδειασε εξηγείται από όσους το είχαν ήδη περιορίσει
+                wiped = next((B for B, _ in reversed(removals) if not csp.curr_domains[B]), None)
+                if wiped is not None:
+                    conflict.update(pruned_by[wiped])
+                else:
+                    # Αποτυχία χωρίς άδειο πεδίο (π.χ. καθολικός περιορισμός): συντηρητική εξήγηση
+                    conflict.update(x for x in assignment if x != var)
+                csp.restore(removals)
+        csp.unassign(var, assignment)
+        # Οι τιμές του var είχαν ήδη αφαιρεθεί εν μέρει από προηγούμενες αναθέσεις
+        conflict.update(pruned_by[var])
+        store.add((x, assignment[x]) for x in conflict)
+        return None, conflict
+
+    solution, _ = backtrack()
+    return solution, store
@@ -0,0 +1,171 @@
+"""
+Τοπική Αναζήτηση Min-Conflicts για τον Χρονοπρογραμματισμό Εξετάσεων
+
+Μηχανή ελαχίστων συγκρούσεων πάνω στο μεταγλωττισμένο μοντέλο ακεραίων:
+- Πίνακας συγκρούσεων conflicts[i, u]: πόσες εξετάσεις συγκρούονται με την i
+  αν αυτή πάρει την τιμή u. Ενημερώνεται αυξητικά σε κάθε κίνηση μόνο για τις
+  στήλες της παλιάς και της νέας τιμής και για τους δυαδικούς γείτονες.
+- Οι εξετάσεις σε σύγκρουση κρατούνται σε σύνολο με δείκτες, ώστε η τυχαία
+  επιλογή και η ενημέρωση να γίνονται σε O(1).
+- Λίστα ταμπού (tabu) για πρόσφατα εγκαταλειμμένες τιμές και τυχαίο περίπατο
+  (random walk) με πιθανότητα noise για διαφυγή από τοπικά ελάχιστα.
+"""
+import random
+import numpy as np
+
+from exam_model import NUM_VALUES
+
+def incompatibility_tables(support):
+    """
+    Πίνακες (κλάση σχέσης, u, v) με 1 όπου οι τιμές u, v είναι ασύμβατες, χωρίς
+    τη διαγώνιο: η σύγκρουση ίδιας χρονοθυρίδας μετριέται από τον καθολικό
+    περιορισμό δωματίου για όλα τα ζεύγη.
+    """
+    tables = np.zeros((len(support), NUM_VALUES, NUM_VALUES), dtype=np.int32)
+    for rel, table in enumerate(support):
+        for u, mask in enumerate(table):
+            for v in range(NUM_VALUES):
+                if u != v and not mask >> v & 1:
+                    tables[rel, u, v] = 1
+    return tables
+
+class ConflictSet:
+    """Σύνολο ακεραίων με O(1) προσθήκη, αφαίρεση και τυχαία επιλογή."""
+
+    def __init__(self):
+        self.items = []
+        self.position = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, item):
+        if item not in self.position:
+            self.position[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item):
+        k = self.position.pop(item, None)
+        if k is None:
+            return
+        last = self.items.pop()
+        if k < len(self.items):
+            self.items[k] = last
+            self.position[last] = k
+
+    def choice(self, rng):
+        return self.items[rng.randrange(len(self.items))]
+
+class MinConflictsSearch:
+    """Min-conflicts με αυξητικό πίνακα συγκρούσεων, ταμπού και τυχαίο περίπατο."""
+
+    def __init__(self, model, tabu_tenure=10, noise=0.05, seed=None):
+        """
+        Παράμετροι:
+            model: CompiledExamModel του προβλήματος
+            tabu_tenure: Βήματα για τα οποία μια εγκαταλειμμένη τιμή απαγορεύεται
+            noise: Πιθανότητα τυχαίας κίνησης αντί για την καλύτερη
+            seed: Σπόρος της γεννήτριας τυχαίων αριθμών
+        """
+        if any(width > 1 for width in model.width):
+            raise ValueError("Η τοπική αναζήτηση απαιτεί μοντέλο χωρίς σύνθετες μεταβλητές θεωρίας-εργαστηρίου")
+        self.model = model
+        self.n = len(model.variables)
+        self.tabu_tenure = tabu_tenure
+        self.noise = noise
+        self.rng = random.Random(seed)
+        self.steps = 0
+
+        # Γείτονες και κλάσεις σχέσεων ως πίνακες για διανυσματικές ενημερώσεις
+        tables = incompatibility_tables(model.support)
+        self.neighbors = []
+        self.extra = []
+        for i, related in enumerate(model.binary_neighbors()):
+            related = np.array(related, dtype=np.intp)
+            rels = np.array([model.relation(j, i) for j in related], dtype=np.intp)
+            self.neighbors.append(related)
+            # extra[i][v, k, :]: επιπλέον συγκρούσεις του γείτονα k όταν το i έχει την τιμή v
+            self.extra.append(np.ascontiguousarray(tables[rels].transpose(2, 0, 1)))
+
+    def _move(self, i, value):
+        """Ανάθεση i=value με αυξητική ενημέρωση του πίνακα και του συνόλου συγκρούσεων."""
+        conflicts = self.conflicts
+        values = self.values
+        old = int(values[i])
+        related = self.neighbors[i]
+        extra = self.extra[i]
+        slot_users = self.slot_users
+        if old >= 0:
+            conflicts[:, old] -= 1
+            conflicts[i, old] += 1
+            if len(related):
+                conflicts[related] -= extra[old]
+            slot_users[old].discard(i)
+        conflicts[:, value] += 1
+        conflicts[i, value] -= 1
+        if len(related):
+            conflicts[related] += extra[value]
+        values[i] = value
+        slot_users[value].add(i)
+
+        # Αλλαγή κατάστασης σύγκρουσης μόνο για το i, τους γείτονές του και όσους
+        # μοιράζονται την παλιά ή τη νέα χρονοθυρίδα
+        touched = [i]
+        touched.extend(related.tolist())
+        if old >= 0:
+            touched.extend(slot_users[old])
+        touched.extend(slot_users[value])
+        touched = np.array(touched, dtype=np.intp)
+        current = values[touched]
+        assigned = current >= 0
+        in_conflict = assigned & (conflicts[touched, np.where(assigned, current, 0)] > 0)
+        for j, flag in zip(touched.tolist(), in_conflict.tolist()):
+            if flag:
+                self.conflicted.add(j)
+            else:
+                self.conflicted.discard(j)
+
+    def _best_value(self, i, allowed):
+        """Τιμή με τις λιγότερες συγκρούσεις μεταξύ των επιτρεπτών, με τυχαία ισοπαλία."""
+        row = np.where(allowed, self.conflicts[i], self.n + NUM_VALUES)
+        best = (row == row.min()).nonzero()[0]
+        return int(best[self.rng.randrange(len(best))])
+
+    def solve(self, max_steps=1_000_000):
+        """
+        Εκτέλεση της αναζήτησης.
+
+        Επιστρέφει:
+            Λίστα κωδικών τιμών ανά εξέταση αν βρεθεί λύση, αλλιώς None
+        """
+        n = self.n
+        self.conflicts = np.zeros((n, NUM_VALUES), dtype=np.int32)
+        self.values = np.full(n, -1, dtype=np.intp)
+        self.slot_users = [set() for _ in range(NUM_VALUES)]
+        self.conflicted = ConflictSet()
+        tabu_until = np.zeros((n, NUM_VALUES), dtype=np.int64)
+        all_values = np.ones(NUM_VALUES, dtype=bool)
+
+        # Αρχική πλήρης ανάθεση: κάθε εξέταση παίρνει την τιμή με τις λιγότερες συγκρούσεις
+        order = list(range(n))
+        self.rng.shuffle(order)
+        for i in order:
+            self._move(i, self._best_value(i, all_values))
+
+        rng = self.rng
+        for step in range(max_steps):
+            if not self.conflicted:
+                self.steps = step
+                return self.values.tolist()
+            i = self.conflicted.choice(rng)
+            current = int(self.values[i])
+            if rng.random() < self.noise:
+                value = rng.randrange(NUM_VALUES)
+            else:
+                value = self._best_value(i, tabu_until[i] <= step)
+            if value != current:
+                tabu_until[i, current] = step + self.tabu_tenure
+                self._move(i, value)
+
+        self.steps = max_steps
+        return self.values.tolist() if not self.conflicted else None
@@ -0,0 +1,107 @@
+"""
+Ακριβής Επιλυτής Ακέραιου Προγραμματισμού (MIP) για τον Χρονοπρογραμματισμό Εξετάσεων
+
+Το ExamSchedulerCSP μεταγλωττίζεται σε μοντέλο 0/1 με μία δυαδική μεταβλητή
+x[i, u] για κάθε εξέταση i και κάθε τιμή έναρξης u = (ημέρα, χρονοθυρίδα) του πεδίου της:
+- Κάθε εξέταση παίρνει ακριβώς μία τιμή.
+- Δωμάτιο: κάθε χρονοθυρίδα καλύπτεται από το πολύ μία εξέταση (με τα πλάτη των
+  σύνθετων μεταβλητών θεωρίας-εργαστηρίου).
+- Ίδιο εξάμηνο ή ίδιος καθηγητής: ανά ομάδα και ημέρα το πολύ μία εξέταση (κλίκα),
+  ισχυρότερο από τους περιορισμούς ανά ζεύγος στη χαλάρωση LP.
+- Δύσκολα μαθήματα: σε κάθε δύο διαδοχικές ημέρες το πολύ ένα δύσκολο μάθημα.
+- Θεωρία-εργαστήριο: το εργαστήριο ξεκινά ακριβώς στην επόμενη χρονοθυρίδα της θεωρίας.
+- Σπάσιμο συμμετρίας: γραμμική σειρά των κωδικών τιμών μεταξύ εναλλάξιμων μαθημάτων.
+Το μοντέλο λύνεται με τον CBC μέσω του PuLP, που εισάγεται μόνο όταν χρειαστεί.
+"""
+from exam_model import NUM_DAYS, NUM_VALUES, DAY, SLOT, VALUE_CODE, decode_value
+
+def _import_pulp():
+    try:
+        import pulp
+    except ImportError as exc:
+        raise ImportError("Ο επιλυτής MIP απαιτεί το πακέτο pulp (pip install pulp)") from exc
+    return pulp
+
+def build_exam_mip(csp):
+    """
+    Μοντέλο 0/1 του csp (ExamSchedulerCSP).
+
+    Επιστρέφει:
+        (pulp.LpProblem, x) με x[(i, u)] τη δυαδική μεταβλητή της εξέτασης i με έναρξη u
+    """
+    pulp = _import_pulp()
+    model = csp.model
+    n = len(model.variables)
+    problem = pulp.LpProblem('exam_scheduling', pulp.LpMinimize)
+
+    starts = [sorted(VALUE_CODE[value] for value in csp.domains[var]) for var in model.variables]
+    x = {(i, u): pulp.LpVariable(f'x_{i}_{u}', cat=pulp.LpBinary)
+         for i in range(n) for u in starts[i]}
+    # Πρόβλημα ικανοποίησης: σταθερή αντικειμενική συνάρτηση
+    problem += pulp.lpSum([])
+
+    # Ημέρα κάθε εξέτασης ως άθροισμα των μεταβλητών της
+    on_day = [[[] for _ in range(NUM_DAYS + 1)] for _ in range(n)]
+    covering = [[] for _ in range(NUM_VALUES)]
+    for (i, u), var in x.items():
+        on_day[i][DAY[u]].append(var)
+        for code in range(u, u + model.width[i]):
+            covering[code].append(var)
+
+    for i in range(n):
+        problem += pulp.lpSum(x[i, u] for u in starts[i]) == 1, f'assign_{i}'
+
+    for code, users in enumerate(covering):
+        if len(users) > 1:
+            problem += pulp.lpSum(users) <= 1, f'room_{code}'
+
+    for key, members in model.day_groups().items():
+        if len(members) < 2:
+            continue
+        name = '_'.join(str(part) for part in key)
+        # Τα δύσκολα απέχουν τουλάχιστον 2 ημέρες: παράθυρο δύο ημερών, αλλιώς μία
+        span = 2 if key == ('difficult',) else 1
+        for day in range(1, NUM_DAYS - span + 2):
+            window = [var for i in members for d in range(day, day + span) for var in on_day[i][d]]
+            problem += pulp.lpSum(window) <= 1, f'day_{name}_{day}'
+
+    for i in range(n):
+        j = model.lab_child[i]
+        if j < 0:
+            continue
+        # Η θεωρία στη χρονοθυρίδα 3 δεν αφήνει χώρο για το εργαστήριο. Μαζί με την
+        # ανάθεση ακριβώς μίας τιμής, οι ισότητες αποκλείουν κάθε άλλη έναρξη του εργαστηρίου
+        for u in starts[i]:
+            if SLOT[u] < 3 and (j, u + 1) in x:
+                problem += x[i, u] == x[j, u + 1], f'lab_{i}_{u}'
+            else:
+                problem += x[i, u] == 0, f'lab_{i}_{u}'
+
+    for i, j in sorted(model.precedence):
+        problem += (pulp.lpSum(u * x[i, u] for u in starts[i]) + 1 <=
+                    pulp.lpSum(v * x[j, v] for v in starts[j])), f'order_{i}_{j}'
+
+    return problem, x
+
+def solve_exam_mip(csp, time_limit=None, msg=False):
+    """
+    Επίλυση του csp με CBC.
+
+    Παράμετροι:
+        csp: Το πρόβλημα (ExamSchedulerCSP)
+        time_limit: Χρονικό όριο του επιλυτή σε δευτερόλεπτα (None: χωρίς όριο)
+        msg: Εμφάνιση της εξόδου του CBC
+
+    Επιστρέφει:
+        (λύση ή None, κατάσταση του επιλυτή)
+    """
+    pulp = _import_pulp()
+    problem, x = build_exam_mip(csp)
+    problem.solve(pulp.PULP_CBC_CMD(msg=msg, timeLimit=time_limit))
+    status = pulp.LpStatus[problem.status]
+    if problem.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+        return None, status
+
+    variables = csp.model.variables
+    solution = {variables[i]: decode_value(u) for (i, u), var in x.items() if var.value() > 0.5}
+    return solution, status
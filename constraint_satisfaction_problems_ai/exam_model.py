@@ -0,0 +1,384 @@
+"""
+Μεταγλωττισμένο Μοντέλο Ακεραίων για τον Χρονοπρογραμματισμό Εξετάσεων
+
+Οι μεταβλητές του ExamSchedulerCSP αντιστοιχίζονται σε ακέραια αναγνωριστικά και
+τα χαρακτηριστικά των μαθημάτων (εξάμηνο, καθηγητής, δυσκολία, θεωρία του
+εργαστηρίου) αποθηκεύονται σε επίπεδους πίνακες. Έτσι ο έλεγχος περιορισμών
+γίνεται μόνο με συγκρίσεις ακεραίων, χωρίς επεξεργασία συμβολοσειρών.
+
+Οι τιμές (ημέρα, χρονοθυρίδα) κωδικοποιούνται ως (ημέρα-1)*3 + (χρονοθυρίδα-1),
+δηλαδή ακέραιοι 0..62 σε χρονολογική σειρά.
+
+Προαιρετικά ένα μάθημα με εργαστήριο μπορεί να είναι μία σύνθετη μεταβλητή πλάτους 2:
+η τιμή της είναι η χρονοθυρίδα της θεωρίας (1 ή 2) και το εργαστήριο καταλαμβάνει την
+επόμενη χρονοθυρίδα της ίδιας ημέρας. Ο περιορισμός δωματίου γίνεται τότε "μη επικάλυψη
+των χρονοθυρίδων που καταλαμβάνει κάθε εξέταση".
+
+Προαιρετικά το μοντέλο σπάει συμμετρίες του προβλήματος:
+- Αντανάκλαση ημερών: η απεικόνιση ημέρα -> 22 - ημέρα διατηρεί όλους τους
+  περιορισμούς, οπότε μια εξέταση-άξονας περιορίζεται στο πρώτο μισό της εξεταστικής.
+- Εναλλάξιμα μαθήματα: μαθήματα με ίδιο εξάμηνο, καθηγητή, δυσκολία και εργαστήριο
+  ανταλλάσσονται σε κάθε λύση, οπότε επιβάλλεται αύξουσα σειρά τιμών μεταξύ τους.
+Οι ημέρες δεν είναι γενικά εναλλάξιμες (η απόσταση δύσκολων μαθημάτων εξαρτάται από
+τη διάταξή τους), ούτε οι χρονοθυρίδες (το εργαστήριο ακολουθεί τη θεωρία).
+
+Κάθε ζεύγος μεταβλητών ανήκει σε μία από λίγες κλάσεις σχέσεων. Για κάθε κλάση
+προϋπολογίζεται πίνακας υποστήριξης 63 θέσεων: support[u] είναι η μάσκα bit
+των τιμών v του γείτονα που είναι συμβατές με την τιμή u. Με πεδία τιμών ως
+μάσκες bit, ο έλεγχος υποστήριξης μιας τιμής γίνεται με μία πράξη AND.
+"""
+from collections import defaultdict
+
+NUM_DAYS = 21
+NUM_SLOTS = 3
+NUM_VALUES = NUM_DAYS * NUM_SLOTS
+
+# Αντιστοίχιση τιμών (ημέρα, χρονοθυρίδα) <-> ακέραιος κωδικός
+VALUES = [(day, slot) for day in range(1, NUM_DAYS + 1) for slot in range(1, NUM_SLOTS + 1)]
+VALUE_CODE = {value: code for code, value in enumerate(VALUES)}
+DAY = [day for day, _ in VALUES]
+SLOT = [slot for _, slot in VALUES]
+
+ALL_VALUES_MASK = (1 << NUM_VALUES) - 1
+
+# Κλάσεις σχέσεων μεταξύ δύο εξετάσεων i, j
+REL_UNRELATED = 0    # Μόνο το μοναδικό δωμάτιο: διαφορετική χρονοθυρίδα
+REL_SAME_DAY = 1     # Ίδιο εξάμηνο ή ίδιος καθηγητής: διαφορετική ημέρα
+REL_DIFFICULT = 2    # Και τα δύο δύσκολα: τουλάχιστον 2 ημέρες απόσταση
+REL_LAB_OF = 3       # Το i είναι το εργαστήριο της θεωρίας j
+REL_THEORY_OF = 4    # Το i είναι η θεωρία του εργαστηρίου j
+
+def encode_value(value):
+    """Κωδικός ακεραίου για την τιμή (ημέρα, χρονοθυρίδα)."""
+    return VALUE_CODE[value]
+
+def decode_value(code):
+    """Τιμή (ημέρα, χρονοθυρίδα) για τον ακέραιο κωδικό."""
+    return VALUES[code]
+
+def domain_mask(values):
+    """Μάσκα bit ενός πεδίου τιμών (ημέρα, χρονοθυρίδα)."""
+    mask = 0
+    for value in values:
+        mask |= 1 << VALUE_CODE[value]
+    return mask
+
+def footprint_mask(code, width):
+    """Μάσκα των χρονοθυρίδων που καταλαμβάνει εξέταση πλάτους width με έναρξη code."""
+    return ((1 << width) - 1) << code
+
+def start_values(width):
+    """Οι τιμές (ημέρα, χρονοθυρίδα) από τις οποίες μπορεί να ξεκινήσει εξέταση πλάτους width."""
+    return [value for value in VALUES if value[1] + width - 1 <= NUM_SLOTS]
+
+def build_support_table(predicate):
+    """Πίνακας υποστήριξης: για κάθε τιμή u, η μάσκα των τιμών v με predicate(u, v)."""
+    table = []
+    for u in range(NUM_VALUES):
+        mask = 0
+        for v in range(NUM_VALUES):
+            if predicate(u, v):
+                mask |= 1 << v
+        table.append(mask)
+    return table
+
+def iter_codes(mask):
+    """Κωδικοί των τιμών που περιέχει μια μάσκα bit, σε αύξουσα σειρά."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class SparseDomain:
+    """
+    Πεδίο τιμών ως αραιό σύνολο (sparse set): οι τρέχουσες τιμές είναι οι πρώτες
+    size θέσεις του πίνακα values και position δίνει τη θέση κάθε τιμής.
+    - Η αφαίρεση ανταλλάσσει την τιμή με την τελευταία ενεργή και μειώνει το size (O(1)).
+    - Οι αφαιρεμένες τιμές μένουν μετά το size με σειρά αφαίρεσης, οπότε μια
+      ολόκληρη ομάδα αφαιρέσεων αναιρείται επαναφέροντας μόνο το size και τη μάσκα.
+    - Η μάσκα bit του πεδίου ενημερώνεται αυξητικά.
+    Η σειρά των τιμών δεν διατηρείται μετά από αφαιρέσεις.
+    """
+    __slots__ = ('values', 'position', 'size', 'mask', 'stamp')
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.position = {value: k for k, value in enumerate(self.values)}
+        self.size = len(self.values)
+        self.mask = domain_mask(self.values)
+        # Επίπεδο αναζήτησης στο οποίο καταγράφηκε τελευταία η κατάσταση του πεδίου
+        self.stamp = -1
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.values[:self.size])
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return self.values[:self.size][k]
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("εκτός πεδίου")
+        return self.values[k]
+
+    def __contains__(self, value):
+        k = self.position.get(value)
+        return k is not None and k < self.size
+
+    def __repr__(self):
+        return f"SparseDomain({self.values[:self.size]!r})"
+
+    def remove(self, value):
+        """Αφαίρεση τιμής σε O(1) με ανταλλαγή με την τελευταία ενεργή."""
+        k = self.position.get(value)
+        if k is None or k >= self.size:
+            raise ValueError(f"{value} δεν ανήκει στο πεδίο")
+        self.size -= 1
+        last = self.values[self.size]
+        self.values[k] = last
+        self.position[last] = k
+        self.values[self.size] = value
+        self.position[value] = self.size
+        self.mask &= ~(1 << VALUE_CODE[value])
+
+    def append(self, value):
+        """Επανεισαγωγή μίας τιμής (για συμβατότητα με το CSP.restore της AIMA)."""
+        if value in self:
+            return
+        k = self.position.get(value)
+        if k is None:
+            k = len(self.values)
+            self.values.append(value)
+        other = self.values[self.size]
+        self.values[k] = other
+        self.position[other] = k
+        self.values[self.size] = value
+        self.position[value] = self.size
+        self.size += 1
+        self.mask |= 1 << VALUE_CODE[value]
+
+    def reset(self, size, mask):
+        """Επαναφορά σε προηγούμενη κατάσταση (size, mask) του ίδιου πεδίου."""
+        self.size = size
+        self.mask = mask
+
+# Πίνακες υποστήριξης ανά κλάση σχέσης, με δείκτη τη σταθερά REL_*
+SUPPORT_TABLES = [
+    build_support_table(lambda u, v: u != v),
+    build_support_table(lambda u, v: DAY[u] != DAY[v]),
+    build_support_table(lambda u, v: abs(DAY[u] - DAY[v]) >= 2),
+    build_support_table(lambda u, v: u == v + 1 and DAY[u] == DAY[v]),
+    build_support_table(lambda u, v: v == u + 1 and DAY[u] == DAY[v]),
+]
+
+class CompiledExamModel:
+    """Επίπεδη, ακέραια αναπαράσταση των μεταβλητών και των περιορισμών του CSP εξετάσεων."""
+
+    def __init__(self, variables, course_info, lab_pairs, symmetry_breaking=False, composite=()):
+        """
+        Μεταγλώττιση του μοντέλου.
+
+        Παράμετροι:
+            variables: Λίστα μεταβλητών (εξετάσεις θεωρίας και εργαστηρίων)
+            course_info: Πληροφορίες μαθήματος ανά μεταβλητή
+            lab_pairs: Αντιστοίχιση θεωρίας -> μεταβλητή εργαστηρίου
+            symmetry_breaking: Αν True, προστίθενται περιορισμοί σπασίματος συμμετρίας
+            composite: Μεταβλητές θεωρίας που περιλαμβάνουν και το εργαστήριό τους (πλάτος 2)
+        """
+        self.variables = list(variables)
+        self.index = {var: i for i, var in enumerate(self.variables)}
+        n = len(self.variables)
+
+        # Οι καθηγητές κωδικοποιούνται με ακέραιους
+        instructor_code = {}
+        self.semester = [0] * n
+        self.instructor = [0] * n
+        self.difficult = [False] * n
+        for var, i in self.index.items():
+            info = course_info[var]
+            self.semester[i] = info['semester']
+            self.instructor[i] = instructor_code.setdefault(info['instructor'], len(instructor_code))
+            self.difficult[i] = info['is_difficult']
+
+        # lab_parent[i]: θεωρία του εργαστηρίου i, lab_child[i]: εργαστήριο της θεωρίας i (-1 αν δεν υπάρχει)
+        self.lab_parent = [-1] * n
+        self.lab_child = [-1] * n
+        for theory, lab in lab_pairs.items():
+            t, l = self.index[theory], self.index[lab]
+            self.lab_parent[l] = t
+            self.lab_child[t] = l
+
+        # Πλάτος κάθε εξέτασης σε χρονοθυρίδες
+        composite = set(composite)
+        self.width = [2 if var in composite else 1 for var in self.variables]
+
+        self.support = list(SUPPORT_TABLES)
+        self._wide_tables = {}
+
+        # Σπάσιμο συμμετρίας: ζεύγη (i, j) με value(i) < value(j) και η κλάση
+        # σχέσης κάθε διατεταγμένου ζεύγους (και προς τις δύο κατευθύνσεις)
+        self.precedence = set()
+        self.ordered_relation = {}
+        self.reflection_pivot = -1
+        if symmetry_breaking:
+            self._break_symmetries()
+
+    def _break_symmetries(self):
+        """Περιορισμοί αύξουσας σειράς για εναλλάξιμα μαθήματα και άξονας αντανάκλασης ημερών."""
+        groups = defaultdict(list)
+        for i in range(len(self.variables)):
+            if self.lab_parent[i] < 0:
+                key = (self.semester[i], self.instructor[i], self.difficult[i],
+                       self.lab_child[i] >= 0, self.width[i])
+                groups[key].append(i)
+
+        ordered_tables = {}
+        for members in groups.values():
+            for i, j in zip(members, members[1:]):
+                self.precedence.add((i, j))
+                base = self.relation(i, j)
+                for a, b, before in ((i, j, True), (j, i, False)):
+                    rel = ordered_tables.get((base, before))
+                    if rel is None:
+                        rel = len(self.support)
+                        # Περιορισμός της κλάσης base και επιπλέον u < v (ή u > v)
+                        self.support.append([
+                            mask & (ALL_VALUES_MASK << (u + 1) if before else (1 << u) - 1)
+                            & ALL_VALUES_MASK
+                            for u, mask in enumerate(self.support[base])])
+                        ordered_tables[(base, before)] = rel
+                    self.ordered_relation[(a, b)] = rel
+
+        # Άξονας: η πρώτη εξέταση θεωρίας χωρίς περιορισμό σειράς
+        for i in range(len(self.variables)):
+            if self.lab_parent[i] < 0 and not any(i in pair for pair in self.precedence):
+                self.reflection_pivot = i
+                break
+
+    def reflection_days(self):
+        """Ημέρες που επιτρέπονται στον άξονα αντανάκλασης (το πρώτο μισό της εξεταστικής)."""
+        return range(1, (NUM_DAYS + 1) // 2 + 1)
+
+    def day_groups(self):
+        """
+        Ομάδες εξετάσεων που ανά δύο δεν γράφονται την ίδια ημέρα: ανά εξάμηνο, ανά
+        καθηγητή και τα δύσκολα μαθήματα (κλειδί ('difficult',)), χωρίς τα εργαστήρια.
+        """
+        groups = defaultdict(list)
+        for i in range(len(self.variables)):
+            if self.lab_parent[i] >= 0:
+                continue
+            groups[('semester', self.semester[i])].append(i)
+            groups[('instructor', self.instructor[i])].append(i)
+            if self.difficult[i]:
+                groups[('difficult',)].append(i)
+        return groups
+
+    def binary_neighbors(self):
+        """
+        Λίστες γειτόνων μόνο για τα ζεύγη με δυαδικό περιορισμό (ίδιο εξάμηνο, ίδιος
+        καθηγητής, δύσκολα μαθήματα, θεωρία/εργαστήριο). Το κοινό δωμάτιο δεν
+        δημιουργεί ακμές: είναι ένας καθολικός περιορισμός όλων-διαφορετικών.
+        """
+        neighbors = [set() for _ in self.variables]
+        for members in self.day_groups().values():
+            for i in members:
+                neighbors[i].update(members)
+        for i, lab in enumerate(self.lab_child):
+            if lab >= 0:
+                neighbors[i].add(lab)
+                neighbors[lab].add(i)
+        for i, related in enumerate(neighbors):
+            related.discard(i)
+        return [sorted(related) for related in neighbors]
+
+    def blocked_starts(self, j, occupied):
+        """Μάσκα των τιμών έναρξης του j που επικαλύπτουν τις κατειλημμένες χρονοθυρίδες."""
+        blocked = occupied
+        for k in range(1, self.width[j]):
+            blocked |= occupied >> k
+        return blocked
+
+    def relation(self, i, j):
+        """Κλάση σχέσης (REL_* ή κλάση σειράς του σπασίματος συμμετρίας) του ζεύγους i, j."""
+        ordered = self.ordered_relation.get((i, j))
+        if ordered is not None:
+            return ordered
+        base = self._base_relation(i, j)
+        width_i, width_j = self.width[i], self.width[j]
+        if width_i == 1 and width_j == 1:
+            return base
+        # Σύνθετες μεταβλητές: η κλάση συνδυάζεται με τη μη επικάλυψη χρονοθυρίδων
+        key = (base, width_i, width_j)
+        rel = self._wide_tables.get(key)
+        if rel is None:
+            table = []
+            for u, mask in enumerate(self.support[base]):
+                # Τα v με [v, v + width_j) να τέμνει το [u, u + width_i)
+                low = max(0, u - width_j + 1)
+                table.append(mask & ~footprint_mask(low, u + width_i - low) & ALL_VALUES_MASK)
+            rel = len(self.support)
+            self.support.append(table)
+            self._wide_tables[key] = rel
+        return rel
+
+    def _base_relation(self, i, j):
+        """Κλάση σχέσης REL_* χωρίς σπάσιμο συμμετρίας και χωρίς πλάτη εξετάσεων."""
+        parent_i = self.lab_parent[i]
+        parent_j = self.lab_parent[j]
+        if parent_i >= 0 or parent_j >= 0:
+            if parent_i == j:
+                return REL_LAB_OF
+            if parent_j == i:
+                return REL_THEORY_OF
+            return REL_UNRELATED
+        # Η απόσταση δύσκολων μαθημάτων αποκλείει ήδη και την ίδια ημέρα
+        if self.difficult[i] and self.difficult[j]:
+            return REL_DIFFICULT
+        if self.semester[i] == self.semester[j] or self.instructor[i] == self.instructor[j]:
+            return REL_SAME_DAY
+        return REL_UNRELATED
+
+    def supports(self, i, j):
+        """Πίνακας υποστήριξης των τιμών του j για κάθε τιμή του i."""
+        return self.support[self.relation(i, j)]
+
+    def compatible(self, i, u, j, v):
+        """Επιστρέφει True αν οι εξετάσεις i=u και j=v ικανοποιούν όλους τους περιορισμούς."""
+        # 1. Δεν επιτρέπονται ταυτόχρονες εξετάσεις (διαθέσιμο ένα δωμάτιο),
+        #    ούτε επικάλυψη με το εργαστήριο μιας σύνθετης μεταβλητής
+        if u < v + self.width[j] and v < u + self.width[i]:
+            return False
+
+        # 2. Ακολουθία Θεωρίας-Εργαστηρίου: το εργαστήριο στην επόμενη χρονοθυρίδα της ίδιας ημέρας
+        parent_i = self.lab_parent[i]
+        parent_j = self.lab_parent[j]
+        if parent_i >= 0 or parent_j >= 0:
+            if parent_i == j:
+                return u == v + 1 and DAY[u] == DAY[v]
+            if parent_j == i:
+                return v == u + 1 and DAY[u] == DAY[v]
+            # Τα εργαστήρια δεν έχουν άλλους περιορισμούς πέρα από το μοναδικό δωμάτιο
+            return True
+
+        same_day = DAY[u] == DAY[v]
+
+        # 3. Ίδιο εξάμηνο ή 5. ίδιος καθηγητής: όχι την ίδια ημέρα
+        if same_day and (self.semester[i] == self.semester[j] or
+                         self.instructor[i] == self.instructor[j]):
+            return False
+
+        # 4. Δύσκολα μαθήματα: τουλάχιστον 2 ημέρες απόσταση
+        if self.difficult[i] and self.difficult[j] and abs(DAY[u] - DAY[v]) < 2:
+            return False
+
+        # Σπάσιμο συμμετρίας: αύξουσα σειρά τιμών μεταξύ εναλλάξιμων μαθημάτων
+        if (i, j) in self.precedence:
+            return u < v
+        if (j, i) in self.precedence:
+            return v < u
+
+        return True
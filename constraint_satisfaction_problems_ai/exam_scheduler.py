@@ -1,20 +1,39 @@
 """Υλοποίηση CSP Χρονοπρογραμματισμού Εξετάσεων βασισμένη στο πλαίσιο AIMA Python CSP."""
 
 import time
+import io
+import random
+import contextlib
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from csp import *
-from collections import defaultdict
+from collections import defaultdict, deque
 import itertools
 
 # Import required functions from AIMA's CSP implementation
 from utils import argmin_random_tie
 
+from exam_model import (CompiledExamModel, SparseDomain, VALUE_CODE, NUM_VALUES, decode_value,
+                        iter_codes, footprint_mask, start_values)
+from all_different import AllDifferentPropagator
+from indexed_heap import IndexedHeap
+from exam_local_search import MinConflictsSearch
+from exam_backjumping import cbj_search
+from exam_mip import solve_exam_mip
+from exam_verifier import find_violations, VIOLATION_CLASSES
+
 class ExamSchedulerCSP(CSP):
     """CSP για το πρόβλημα χρονοπρογραμματισμού εξετάσεων."""
 
-    def __init__(self, courses):
-        """Δημιουργία CSP χρονοπρογραμματισμού εξετάσεων."""
-        self.constraint_weights = defaultdict(lambda: 1)
+    def __init__(self, courses, symmetry_breaking=False, merge_labs=False):
+        """
+        Δημιουργία CSP χρονοπρογραμματισμού εξετάσεων.
+
+        Με symmetry_breaking=True προστίθενται περιορισμοί σειράς μεταξύ εναλλάξιμων
+        μαθημάτων και η πρώτη ελεύθερη εξέταση περιορίζεται στο πρώτο μισό των ημερών.
+        Με merge_labs=True κάθε μάθημα με εργαστήριο γίνεται μία σύνθετη μεταβλητή:
+        η τιμή της είναι η χρονοθυρίδα της θεωρίας και το εργαστήριο ακολουθεί.
+        """
 
         # Δημιουργία μεταβλητών και αποθήκευση πληροφοριών μαθημάτων
         variables = []
@@ -40,71 +59,216 @@ class ExamSchedulerCSP(CSP):
             if has_lab:
                 lab_name = f"{name}_Lab"
                 lab_pairs[name] = lab_name
-                variables.append(lab_name)
+                if not merge_labs:
+                    variables.append(lab_name)
                 # Το εργαστήριο κληρονομεί τις πληροφορίες του μαθήματος
                 self.course_info[lab_name] = self.course_info[name].copy()
 
-        # Δημιουργία πεδίων (ημέρα, χρονοθυρίδα)
+        # Μεταγλωττισμένο μοντέλο ακεραίων για γρήγορους ελέγχους περιορισμών
+        self.lab_pairs = lab_pairs
+        # Σύνθετες μεταβλητές θεωρία -> εργαστήριο (κενό αν δεν συγχωνεύονται)
+        self.merged_labs = dict(lab_pairs) if merge_labs else {}
+        if merge_labs:
+            self.model = CompiledExamModel(variables, self.course_info, {}, symmetry_breaking,
+                                           composite=self.merged_labs)
+        else:
+            self.model = CompiledExamModel(variables, self.course_info, lab_pairs, symmetry_breaking)
+
+        # Δημιουργία πεδίων (ημέρα, χρονοθυρίδα): οι σύνθετες ξεκινούν μόνο στις χρονοθυρίδες 1-2
         domains = {}
         for var in variables:
-            domains[var] = [(d, s) for d in range(1, 22) for s in range(1, 4)]
-
-        # Αρχικοποίηση γειτόνων
-        neighbors = {var: [v for v in variables if v != var] for var in variables}
+            domains[var] = start_values(self.model.width[self.model.index[var]])
+        if self.model.reflection_pivot >= 0:
+            pivot = variables[self.model.reflection_pivot]
+            days = self.model.reflection_days()
+            domains[pivot] = [(d, s) for d, s in domains[pivot] if d in days]
+
+        # Αρχικοποίηση γειτόνων: μόνο ζεύγη με πραγματικό δυαδικό περιορισμό.
+        # Το μοναδικό δωμάτιο είναι καθολικός περιορισμός πάνω στις χρονοθυρίδες.
+        neighbors = {var: [variables[j] for j in related]
+                     for var, related in zip(variables, self.model.binary_neighbors())}
+        self.neighbor_sets = {var: set(related) for var, related in neighbors.items()}
+        # Μεταβλητές της τρέχουσας ανάθεσης ανά χρονοθυρίδα
+        self.slot_users = defaultdict(set)
+        # Καθολικός all-different των χρονοθυρίδων με διατηρούμενο ταίριασμα
+        self.slot_propagator = AllDifferentPropagator(variables)
 
         # Αρχικοποίηση CSP
         super().__init__(variables, domains, neighbors, self.constraints)
-        self.curr_domains = {var: list(domains[var]) for var in variables}
+        self.curr_domains = {var: SparseDomain(domains[var]) for var in variables}
+        # Υπολειπόμενες υποστηρίξεις (AC-3rm) ανά τόξο: residues[(i, j)][u] = κωδικός τιμής του j
+        self.residues = {}
+        # Μετρητές διάδοσης του MAC: αναθεωρήσεις τόξων και διπλότυπα τόξα που δεν μπήκαν στην ουρά
+        self.propagation_stats = {'revisions': 0, 'skipped_arcs': 0}
+        # Ίχνος (trail) αναίρεσης: (μεταβλητή, πεδίο, size, mask, stamp) μία φορά ανά πεδίο και επίπεδο,
+        # με δείκτες αρχής επιπέδου (μήκος ίχνους, αναγνωριστικό επιπέδου)
+        self._trail = []
+        self._levels = []
+        self._level_counter = 0
+
+        # Ευρετική dom/wdeg: βάρη περιορισμών με ακέραιους δείκτες του μοντέλου, που αυξάνονται
+        # μόνο όταν ένας περιορισμός αδειάσει ένα πεδίο. room_weights[i] είναι το βάρος του
+        # καθολικού περιορισμού δωματίου για την εξέταση i.
+        n = len(variables)
+        self.constraint_weights = [[1] * n for _ in range(n)]
+        self.room_weights = [1] * n
+        self.wdeg = [1 + len(neighbors[var]) for var in variables]
+        # Σειρά λύσης ισοπαλιών: αρχικά η σειρά δήλωσης, τυχαία μετάθεση σε κάθε επανεκκίνηση
+        self.tiebreak = list(range(n))
+        self._rebuild_selection_heap()
+
+    def _rebuild_selection_heap(self):
+        """Σωρός επιλογής με όλες τις μεταβλητές που δεν έχουν ανατεθεί."""
+        self.selection_heap = IndexedHeap()
+        for var in self.variables:
+            self.selection_heap.push(var, self._selection_key(var))
+
+    def _selection_key(self, var):
+        """Κλειδί επιλογής: dom/wdeg, μετά μέγεθος πεδίου, μετά σειρά ισοπαλίας."""
+        i = self.model.index[var]
+        size = len(self.curr_domains[var])
+        return (size / self.wdeg[i], size, self.tiebreak[i])
+
+    def randomize_ties(self, rng):
+        """Τυχαία σειρά λύσης ισοπαλιών στην επιλογή μεταβλητής."""
+        rng.shuffle(self.tiebreak)
+        self._rebuild_selection_heap()
+
+    def reset_search(self):
+        """
+        Επαναφορά μετά από διακοπή της αναζήτησης: τα πεδία επιστρέφουν στην αρχική τους
+        κατάσταση μέσω του ίχνους, ενώ τα βάρη dom/wdeg διατηρούνται.
+        """
+        while self._levels:
+            self.restore(None)
+        self.slot_users.clear()
+        self._rebuild_selection_heap()
+
+    def _touch(self, var):
+        """Ενημέρωση της θέσης του var στον σωρό επιλογής, αν δεν έχει ανατεθεί."""
+        if var in self.selection_heap:
+            self.selection_heap.update(var, self._selection_key(var))
+
+    def bump_weight(self, A, B=None):
+        """
+        Καταγραφή αποτυχίας διάδοσης: αυξάνει το βάρος του περιορισμού A-B, ή του
+        καθολικού περιορισμού δωματίου για το A αν B is None, και τους σταθμισμένους βαθμούς.
+        """
+        index = self.model.index
+        i = index[A]
+        self.wdeg[i] += 1
+        self._touch(A)
+        if B is None:
+            self.room_weights[i] += 1
+            return
+        j = index[B]
+        self.constraint_weights[i][j] += 1
+        self.constraint_weights[j][i] += 1
+        self.wdeg[j] += 1
+        self._touch(B)
+
+    def weight_table(self):
+        """Τα βάρη των δυαδικών περιορισμών που αυξήθηκαν, ανά ζεύγος ονομάτων."""
+        variables = self.variables
+        return {(variables[i], variables[j]): w
+                for i, row in enumerate(self.constraint_weights)
+                for j, w in enumerate(row) if w > 1}
+
+    def _save(self, var, domain):
+        """Καταγραφή της κατάστασης ενός πεδίου την πρώτη φορά που αλλάζει στο τρέχον επίπεδο."""
+        if self._levels:
+            level = self._levels[-1][1]
+            if domain.stamp != level:
+                self._trail.append((var, domain, domain.size, domain.mask, domain.stamp))
+                domain.stamp = level
+
+    def suppose(self, var, value):
+        """Υπόθεση var=value: ανοίγει νέο επίπεδο στο ίχνος και κρατά μόνο την τιμή value."""
+        self._level_counter += 1
+        self._levels.append((len(self._trail), self._level_counter))
+        domain = self.curr_domains[var]
+        removals = [(var, a) for a in domain if a != value]
+        self._save(var, domain)
+        for _, a in removals:
+            domain.remove(a)
+        return removals
+
+    def prune(self, var, value, removals):
+        """Αφαίρεση var=value με καταγραφή του πεδίου στο ίχνος."""
+        domain = self.curr_domains[var]
+        self._save(var, domain)
+        domain.remove(value)
+        self._touch(var)
+        if removals is not None:
+            removals.append((var, value))
+
+    def restore(self, removals):
+        """Αναίρεση του τελευταίου επιπέδου: O(1) ανά πεδίο που άλλαξε, ανεξάρτητα από τις αφαιρέσεις."""
+        start, _ = self._levels.pop()
+        trail = self._trail
+        while len(trail) > start:
+            var, domain, size, mask, stamp = trail.pop()
+            domain.reset(size, mask)
+            domain.stamp = stamp
+            self._touch(var)
+
+    def choices(self, var):
+        """Οι τιμές του πεδίου σε χρονολογική σειρά, ανεξάρτητα από τη σειρά του αραιού συνόλου."""
+        return [decode_value(code) for code in iter_codes(self.curr_domains[var].mask)]
+
+    def footprint(self, var, val):
+        """Οι χρονοθυρίδες που καταλαμβάνει η εξέταση var=val (και το εργαστήριό της αν είναι σύνθετη)."""
+        if var in self.merged_labs:
+            day, slot = val
+            return [val, (day, slot + 1)]
+        return [val]
+
+    def assign(self, var, val, assignment):
+        """Ανάθεση var=val με ενημέρωση της κατάληψης χρονοθυρίδων."""
+        if var in assignment:
+            for occupied in self.footprint(var, assignment[var]):
+                self.slot_users[occupied].discard(var)
+        for occupied in self.footprint(var, val):
+            self.slot_users[occupied].add(var)
+        self.selection_heap.discard(var)
+        super().assign(var, val, assignment)
+
+    def unassign(self, var, assignment):
+        """Αναίρεση ανάθεσης με ενημέρωση της κατάληψης χρονοθυρίδων."""
+        if var in assignment:
+            for occupied in self.footprint(var, assignment[var]):
+                self.slot_users[occupied].discard(var)
+        self.selection_heap.push(var, self._selection_key(var))
+        super().unassign(var, assignment)
+
+    def nconflicts(self, var, val, assignment):
+        """Συγκρούσεις του var=val με τους δυαδικούς γείτονες και με όσους καταλαμβάνουν τις ίδιες χρονοθυρίδες."""
+        count = 0
+        for B in self.neighbors[var]:
+            if B in assignment and not self.constraints(var, val, B, assignment[B]):
+                count += 1
+        related = self.neighbor_sets[var]
+        clashes = set()
+        for occupied in self.footprint(var, val):
+            clashes.update(self.slot_users[occupied])
+        for B in clashes:
+            if B != var and B not in related and B in assignment:
+                count += 1
+        return count
+
+    def expand_solution(self, solution):
+        """Λύση με ξεχωριστή μεταβλητή εργαστηρίου για κάθε σύνθετη μεταβλητή."""
+        expanded = dict(solution)
+        for theory, lab in self.merged_labs.items():
+            if theory in solution:
+                expanded[lab] = self.footprint(theory, solution[theory])[1]
+        return expanded
 
     def constraints(self, A, a, B, b):
         """Επιστρέφει True αν ικανοποιούνται οι περιορισμοί μεταξύ A=a και B=b."""
-        # Λήψη πληροφοριών μαθήματος, διαχείριση μεταβλητών συστατικών εργαστηρίου
-        course_A = A[:-4] if A.endswith('_Lab') else A
-        course_B = B[:-4] if B.endswith('_Lab') else B
-        info_A = self.course_info[course_A]
-        info_B = self.course_info[course_B]
-
-        day_A, slot_A = a
-        day_B, slot_B = b
-
-        # 1. Δεν επιτρέπονται ταυτόχρονες εξετάσεις (διαθέσιμο ένα δωμάτιο)
-        if day_A == day_B and slot_A == slot_B:
-            return False
-
-        # 2. Περιορισμός ακολουθίας Θεωρίας-Εργαστηρίου (υψηλότερη προτεραιότητα)
-        if A.endswith('_Lab'):
-            if B == A[:-4]:  # Αυτή είναι η θεωρητική εξέταση για αυτό το εργαστήριο
-                return day_A == day_B and slot_A == slot_B + 1
-            elif day_A == day_B and slot_A == slot_B:  # Καμία άλλη εξέταση την ίδια ώρα
-                return False
-        elif B.endswith('_Lab'):
-            if A == B[:-4]:  # Αυτή είναι η θεωρητική εξέταση για αυτό το εργαστήριο
-                return day_A == day_B and slot_B == slot_A + 1
-            elif day_A == day_B and slot_A == slot_B:  # Καμία άλλη εξέταση την ίδια ώρα
-                return False
-
-        # Παράκαμψη υπόλοιπων ελέγχων για συστατικά εργαστηρίου με άλλες εξετάσεις
-        if A.endswith('_Lab') or B.endswith('_Lab'):
-            return True
-
-        # 3. Περιορισμός ίδιου ακαδημαϊκού έτους (εξάμηνο)
-        if info_A['semester'] == info_B['semester'] and day_A == day_B:
-            return False
-
-        # 4. Περιορισμός απόστασης δύσκολων μαθημάτων
-        if info_A['is_difficult'] and info_B['is_difficult']:
-            if abs(day_A - day_B) < 2:
-                return False
-
-        # 5. Περιορισμός ίδιου καθηγητή
-        if info_A['instructor'] == info_B['instructor'] and day_A == day_B:
-            return False
-
-        # Ενημέρωση βαρών περιορισμών για την ευρετική dom/wdeg
-        self.constraint_weights[(A, B)] += 1
-        self.constraint_weights[(B, A)] += 1
-
-        return True
+        # Έλεγχος με ακέραιους κωδικούς στο μεταγλωττισμένο μοντέλο
+        index = self.model.index
+        return self.model.compatible(index[A], VALUE_CODE[a], index[B], VALUE_CODE[b])
 
 def verify_solution(solution, csp):
     """Επαλήθευση ότι η λύση ικανοποιεί όλους τους περιορισμούς."""
@@ -112,12 +276,9 @@ def verify_solution(solution, csp):
         print("Δε βρέθηκε λύση!")
         return False
 
-    violations = []
-    for A, a in solution.items():
-        for B, b in solution.items():
-            if A < B:  # Έλεγχος κάθε ζεύγους μία φορά
-                if not csp.constraints(A, a, B, b):
-                    violations.append((A, B))
+    # Διανυσματικός έλεγχος: κάθε ζεύγος που παραβιάζει περιορισμούς εμφανίζεται μία φορά
+    by_class = find_violations(solution, csp)
+    violations = [pair for name in VIOLATION_CLASSES for pair in by_class[name]]
 
     if violations:
         print(f"Προειδοποίηση: Βρέθηκαν {len(violations)} παραβιάσεις περιορισμών!")
@@ -129,135 +290,296 @@ def verify_solution(solution, csp):
     return True
 
 def revise(csp, Xi, Xj, removals):
-    """Επιστρέφει true αν αφαιρέσουμε μια τιμή από curr_domains[Xi]."""
+    """
+    Επιστρέφει true αν αφαιρέσουμε μια τιμή από curr_domains[Xi] (AC-3rm).
+
+    Για κάθε τιμή του Xi ελέγχεται πρώτα η τελευταία υποστήριξη που βρέθηκε στο Xj.
+    Μόνο αν αυτή έχει αφαιρεθεί αναζητείται νέα, με μία πράξη AND στη μάσκα του πεδίου.
+    """
+    model = csp.model
+    i, j = model.index[Xi], model.index[Xj]
+    support = model.supports(i, j)
+    mask_j = csp.curr_domains[Xj].mask
+    residue = csp.residues.get((i, j))
+    if residue is None:
+        residue = csp.residues[(i, j)] = [-1] * NUM_VALUES
+
+    domain_i = csp.curr_domains[Xi]
     revised = False
-    for x in csp.curr_domains[Xi][:]:  # Σημείωση: χρήση αντιγράφου λίστας
-        # Αν Xi=x συγκρούεται με κάθε πιθανή τιμή στο πεδίο του Xj
-        if not any(csp.constraints(Xi, x, Xj, y) for y in csp.curr_domains[Xj]):
-            csp.curr_domains[Xi].remove(x)
-            if removals is not None:
-                removals.append((Xi, x))
-            revised = True
+    # Σάρωση από το τέλος: η αφαίρεση μετακινεί στη θέση k μόνο ήδη ελεγμένη τιμή
+    for k in range(len(domain_i) - 1, -1, -1):
+        x = domain_i[k]
+        u = VALUE_CODE[x]
+        r = residue[u]
+        if r >= 0 and mask_j >> r & 1:
+            continue
+        common = support[u] & mask_j
+        if common:
+            residue[u] = (common & -common).bit_length() - 1
+            continue
+        # Το Xi=x συγκρούεται με κάθε πιθανή τιμή στο πεδίο του Xj
+        csp.prune(Xi, x, removals)
+        revised = True
     return revised
 
+def forward_checking(csp, var, value, assignment, removals):
+    """Forward checking με τους πίνακες υποστήριξης (αντικαθιστά την έκδοση της AIMA)."""
+    model = csp.model
+    i = model.index[var]
+    u = VALUE_CODE[value]
+    for B in csp.neighbors[var]:
+        if B not in assignment:
+            support = model.supports(i, model.index[B])[u]
+            # Μόνο οι τιμές του B χωρίς υποστήριξη, απευθείας από τις μάσκες
+            for code in iter_codes(csp.curr_domains[B].mask & ~support):
+                csp.prune(B, decode_value(code), removals)
+            if not csp.curr_domains[B]:
+                csp.bump_weight(var, B)
+                return False
+
+    # Καθολικός περιορισμός δωματίου: οι κατειλημμένες χρονοθυρίδες αφαιρούνται από όλες
+    # τις υπόλοιπες εξετάσεις (για σύνθετες, και οι αρχές που θα τις επικάλυπταν)
+    occupied = footprint_mask(u, model.width[i])
+    for B in csp.variables:
+        if B not in assignment:
+            domain = csp.curr_domains[B]
+            blocked = domain.mask & model.blocked_starts(model.index[B], occupied)
+            if blocked:
+                for code in iter_codes(blocked):
+                    csp.prune(B, decode_value(code), removals)
+                if not domain:
+                    csp.bump_weight(B)
+                    return False
+    return True
+
+def alldiff_inference(csp, var, value, assignment, removals):
+    """Forward checking και διάδοση του καθολικού all-different των χρονοθυρίδων."""
+    if not forward_checking(csp, var, value, assignment, removals):
+        return False
+    if not csp.slot_propagator.propagate(csp, removals):
+        csp.bump_weight(var)
+        return False
+    return True
+
 def mac_inference(csp, var, value, assignment, removals):
-    """MAC ως μέθοδος συμπερασμού για αναζήτηση οπισθοδρόμησης."""
-    # Πρώτα έλεγχος προώθησης
+    """
+    MAC ως μέθοδος συμπερασμού για αναζήτηση οπισθοδρόμησης.
+
+    Η ουρά τόξων είναι deque με σύνολο των τόξων που ήδη περιμένουν, ώστε κάθε
+    τόξο να αναθεωρείται μία φορά ανά εισαγωγή αντί για όσες φορές προστέθηκε.
+    """
+    # Πρώτα έλεγχος προώθησης και διάδοση του all-different
     if not forward_checking(csp, var, value, assignment, removals):
         return False
+    start = len(removals)
+    if not csp.slot_propagator.propagate(csp, removals):
+        csp.bump_weight(var)
+        return False
 
-    # Στη συνέχεια καθιέρωση συνεκτικότητας τόξου
-    queue = [(X, var) for X in csp.neighbors[var]]
+    stats = csp.propagation_stats
+    queue = deque()
+    queued = set()
+
+    def enqueue(X, Y):
+        if (X, Y) in queued:
+            stats['skipped_arcs'] += 1
+        else:
+            queued.add((X, Y))
+            queue.append((X, Y))
+
+    # Στη συνέχεια καθιέρωση συνεκτικότητας τόξου, και για όσες μεταβλητές περιόρισε ο all-different
+    for X in csp.neighbors[var]:
+        enqueue(X, var)
+    for Y in {Y for Y, _ in removals[start:]}:
+        for X in csp.neighbors[Y]:
+            enqueue(X, Y)
     while queue:
-        (X, Y) = queue.pop(0)
+        arc = queue.popleft()
+        queued.discard(arc)
+        X, Y = arc
+        stats['revisions'] += 1
         if revise(csp, X, Y, removals):
             if not csp.curr_domains[X]:
+                csp.bump_weight(X, Y)
                 return False
             for Z in csp.neighbors[X]:
                 if Z != Y:
-                    queue.append((Z, X))
+                    enqueue(Z, X)
     return True
 
 def combined_heuristic_selector(assignment, csp):
-    """Συνδυάζει ευρετικές MRV και dom/wdeg για επιλογή μεταβλητών."""
-    unassigned = [v for v in csp.variables if v not in assignment]
-    if not unassigned:
-        return None
-
-    def compute_weight(var):
-        return sum(csp.constraint_weights.get((var, n), 1)
-                  for n in csp.neighbors[var])
-
-    # Λήψη βαθμολογίας MRV (λιγότερες εναπομένουσες τιμές = υψηλότερη βαθμολογία)
-    mrv_scores = {var: 1.0 / len(csp.curr_domains[var]) for var in unassigned}
-
-    # Λήψη βαθμολογίας dom/wdeg (μικρότερο μέγεθος πεδίου / βάρος = υψηλότερη βαθμολογία)
-    wdeg_scores = {var: len(csp.curr_domains[var]) / compute_weight(var)
-                  for var in unassigned}
-
-    # Κανονικοποίηση βαθμολογιών στο εύρος [0,1]
-    max_mrv = max(mrv_scores.values())
-    max_wdeg = max(wdeg_scores.values())
-
-    # Συνδυασμός βαθμολογιών (υψηλότερη βαθμολογία = καλύτερη επιλογή)
-    return min(unassigned,
-              key=lambda var: (wdeg_scores[var] / max_wdeg +
-                             mrv_scores[var] / max_mrv))
+    """
+    Επιλογή μεταβλητής με dom/wdeg και MRV ως δευτερεύον κριτήριο.
+
+    Οι μη ανατεθειμένες μεταβλητές βρίσκονται σε σωρό που ενημερώνεται μόνο όταν
+    αλλάζει ένα πεδίο ή ένα βάρος, οπότε η επιλογή δεν σαρώνει όλες τις μεταβλητές.
+    """
+    return csp.selection_heap.peek()
+
+class RestartSearch(Exception):
+    """Υπέρβαση του ορίου αποτυχιών της τρέχουσας εκτέλεσης: επανεκκίνηση της αναζήτησης."""
+
+def luby(i):
+    """i-οστός όρος (από 1) της ακολουθίας Luby: 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    if i == (1 << k) - 1:
+        return 1 << (k - 1)
+    return luby(i - (1 << (k - 1)) + 1)
+
+def restarting_search(csp, inference, order_domain_values=unordered_domain_values,
+                      scale=100, seed=None, max_restarts=None):
+    """
+    Αναζήτηση οπισθοδρόμησης με επανεκκινήσεις κατά Luby.
+
+    Η εκτέλεση k διακόπτεται μετά από scale * luby(k) αποτυχίες συμπερασμού. Σε κάθε
+    επανεκκίνηση τα πεδία επανέρχονται, οι ισοπαλίες της επιλογής μεταβλητής
+    λύνονται τυχαία και τα βάρη dom/wdeg μεταφέρονται. Αν seed is None η πρώτη
+    εκτέλεση κρατά την ντετερμινιστική σειρά, αλλιώς τυχαιοποιείται κι αυτή.
+
+    Επιστρέφει:
+        (λύση ή None, αριθμός_επανεκκινήσεων)
+    """
+    rng = random.Random(seed)
+    restarts = 0
+    while max_restarts is None or restarts <= max_restarts:
+        if restarts or seed is not None:
+            csp.randomize_ties(rng)
+        limit = scale * luby(restarts + 1)
+        failures = 0
+
+        def limited_inference(csp, var, value, assignment, removals):
+            nonlocal failures
+            if inference(csp, var, value, assignment, removals):
+                return True
+            failures += 1
+            if failures >= limit:
+                raise RestartSearch
+            return False
 
-def schedule_exams_fc(courses):
-    """Επίλυση χρονοπρογραμματισμού εξετάσεων με Forward Checking."""
+        try:
+            solution = backtracking_search(
+                csp,
+                select_unassigned_variable=combined_heuristic_selector,
+                order_domain_values=order_domain_values,
+                inference=limited_inference
+            )
+            return solution, restarts
+        except RestartSearch:
+            csp.reset_search()
+            restarts += 1
+    return None, restarts
+
+def schedule_exams_fc(courses, restarts=True, seed=None, symmetry_breaking=False, merge_labs=False,
+                      return_csp=False):
+    """
+    Επίλυση χρονοπρογραμματισμού εξετάσεων με Forward Checking (με επανεκκινήσεις Luby).
+    Με return_csp=True επιστρέφει (λύση, csp), ώστε να διαβάζονται τα βάρη dom/wdeg της αναζήτησης.
+    """
     print("\nΈναρξη αλγορίθμου Forward Checking...")
-    csp = ExamSchedulerCSP(courses)
-    solution = backtracking_search(
-        csp,
-        select_unassigned_variable=combined_heuristic_selector,
-        inference=forward_checking
-    )
+    csp = ExamSchedulerCSP(courses, symmetry_breaking, merge_labs)
+    if restarts:
+        solution, count = restarting_search(csp, forward_checking, seed=seed)
+        print(f"FC: {count} επανεκκινήσεις")
+    else:
+        solution = backtracking_search(
+            csp,
+            select_unassigned_variable=combined_heuristic_selector,
+            inference=forward_checking
+        )
     if solution:
         print(f"FC: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές")
         verify_solution(solution, csp)
+        solution = csp.expand_solution(solution)
+    if return_csp:
+        return solution, csp
     return solution
 
-def schedule_exams_mac(courses):
-    """Επίλυση χρονοπρογραμματισμού εξετάσεων με MAC."""
+def schedule_exams_mac(courses, restarts=True, seed=None, symmetry_breaking=False, merge_labs=False,
+                       return_csp=False):
+    """
+    Επίλυση χρονοπρογραμματισμού εξετάσεων με MAC (με επανεκκινήσεις Luby).
+    Με return_csp=True επιστρέφει (λύση, csp), ώστε να διαβάζονται τα βάρη dom/wdeg της αναζήτησης.
+    """
     print("\nΈναρξη αλγορίθμου MAC...")
-    csp = ExamSchedulerCSP(courses)
+    csp = ExamSchedulerCSP(courses, symmetry_breaking, merge_labs)
+
+    if restarts:
+        solution, count = restarting_search(csp, mac_inference, order_domain_values=lcv, seed=seed)
+        print(f"MAC: {count} επανεκκινήσεις")
+    else:
+        solution = backtracking_search(
+            csp,
+            select_unassigned_variable=combined_heuristic_selector,
+            order_domain_values=lcv,
+            inference=mac_inference
+        )
+    stats = csp.propagation_stats
+    print(f"MAC: {stats['revisions']} αναθεωρήσεις τόξων, "
+          f"{stats['skipped_arcs']} διπλότυπα τόξα παραλείφθηκαν")
+    if solution:
+        print(f"MAC: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές")
+        verify_solution(solution, csp)
+        solution = csp.expand_solution(solution)
+    if return_csp:
+        return solution, csp
+    return solution
 
-    def mac(csp, var, value, assignment, removals):
-        """MAC ως μέθοδος συμπερασμού."""
-        if not forward_checking(csp, var, value, assignment, removals):
-            return False
+def schedule_exams_cbj(courses, nogood_capacity=10000, max_nogood_size=8, symmetry_breaking=False,
+                       merge_labs=False):
+    """Επίλυση χρονοπρογραμματισμού εξετάσεων με FC-CBJ και μάθηση nogoods."""
+    print("\nΈναρξη αλγορίθμου FC-CBJ...")
+    csp = ExamSchedulerCSP(courses, symmetry_breaking, merge_labs)
+    solution, store = cbj_search(csp, forward_checking, combined_heuristic_selector, nogood_capacity,
+                                 max_nogood_size)
+    print(f"FC-CBJ: {store.stats['stored']} nogoods, {store.stats['hits']} αποκοπές από nogoods, "
+          f"{store.stats['evicted']} απομακρύνσεις, {store.stats['too_long']} πολύ μακριά nogoods")
+    if solution:
+        print(f"FC-CBJ: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές")
+        verify_solution(solution, csp)
+        solution = csp.expand_solution(solution)
+    return solution
 
-        # Στη συνέχεια καθιέρωση συνεκτικότητας τόξου
-        queue = [(X, var) for X in csp.neighbors[var]]
-        while queue:
-            (X, Y) = queue.pop(0)
-            if revise(csp, X, Y, removals):
-                if not csp.curr_domains[X]:
-                    return False
-                for Z in csp.neighbors[X]:
-                    if Z != Y:
-                        queue.append((Z, X))
-        return True
-
-    solution = backtracking_search(
-        csp,
-        select_unassigned_variable=combined_heuristic_selector,
-        order_domain_values=lcv,
-        inference=mac
-    )
+def schedule_exams_mip(courses, time_limit=None, symmetry_breaking=False, merge_labs=False):
+    """
+    Επίλυση χρονοπρογραμματισμού εξετάσεων ως μοντέλο ακέραιου προγραμματισμού 0/1
+    με τον CBC (απαιτεί το πακέτο pulp). Αποδεικνύει και τη μη ύπαρξη λύσης.
+    """
+    print("\nΈναρξη επιλυτή MIP (CBC)...")
+    csp = ExamSchedulerCSP(courses, symmetry_breaking, merge_labs)
+    solution, status = solve_exam_mip(csp, time_limit=time_limit)
+    print(f"MIP: κατάσταση επιλυτή {status}")
     if solution:
-        print(f"MAC: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές")
+        print(f"MIP: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές")
         verify_solution(solution, csp)
+        solution = csp.expand_solution(solution)
     return solution
 
-def schedule_exams_minconflicts(courses, max_steps=1000):
-    """Επίλυση χρονοπρογραμματισμού εξετάσεων με Min-Conflicts."""
+def schedule_exams_minconflicts(courses, max_steps=1_000_000, seed=None):
+    """Επίλυση χρονοπρογραμματισμού εξετάσεων με Min-Conflicts (τοπική αναζήτηση με ταμπού)."""
     print("\nΈναρξη αλγορίθμου Min-Conflicts...")
     csp = ExamSchedulerCSP(courses)
 
-    def conflicts(csp, var, val, assignment):
-        """Επιστρέφει τον αριθμό συγκρούσεων που έχει το var=val με άλλες μεταβλητές."""
-        count = 0
-        for other in csp.neighbors[var]:
-            if other in assignment:
-                if not csp.constraints(var, val, other, assignment[other]):
-                    count += 1
-                    # Ενημέρωση βαρών περιορισμών για dom/wdeg
-                    csp.constraint_weights[(var, other)] += 1
-                    csp.constraint_weights[(other, var)] += 1
-        return count
-
-    # Αρχικοποίηση με τυχαία πλήρη ανάθεση
-    solution = min_conflicts(csp, max_steps=max_steps)
+    search = MinConflictsSearch(csp.model, seed=seed)
+    codes = search.solve(max_steps=max_steps)
+    solution = None
+    if codes is not None:
+        solution = {var: decode_value(code) for var, code in zip(csp.model.variables, codes)}
 
     if solution:
-        print(f"Min-Conflicts: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές")
+        print(f"Min-Conflicts: Βρέθηκε λύση με {len(solution)}/{len(csp.variables)} μεταβλητές "
+              f"σε {search.steps} βήματα")
         verify_solution(solution, csp)
     return solution
 
-def format_solution(solution):
-    """Μορφοποίηση της λύσης σε αναγνώσιμο πρόγραμμα."""
+def format_solution(solution, csp=None):
+    """
+    Μορφοποίηση της λύσης σε αναγνώσιμο πρόγραμμα. Αν δοθεί το csp, οι σύνθετες
+    μεταβλητές θεωρίας-εργαστηρίου αναπτύσσονται σε δύο εξετάσεις.
+    """
+    if csp is not None:
+        solution = csp.expand_solution(solution)
     schedule = []
     time_slots = ['9:00-12:00', '12:00-15:00', '15:00-18:00']
 
@@ -283,7 +605,7 @@ def compare_algorithms(courses):
                 'time': time.time() - start_time,
                 'num_variables': len(csp.variables),
                 'num_assigned': 0,
-                'constraints_checked': csp.constraint_weights.copy(),
+                'constraints_checked': csp.weight_table(),
                 'violations': [],
                 'schedule': None,
                 'days_used': 0,
@@ -291,29 +613,13 @@ def compare_algorithms(courses):
                 'lab_sequencing_violations': 0,
                 'same_day_violations': 0,
                 'difficult_course_violations': 0,
-                'instructor_violations': 0
+                'instructor_violations': 0,
+                'slot_clash_violations': 0
             }
 
-        # Ανάλυση παραβιάσεων περιορισμών ανά τύπο
-        violations = []
-        lab_seq = 0
-        same_day = 0
-        difficult = 0
-        instructor = 0
-
-        for A, a in solution.items():
-            for B, b in solution.items():
-                if A < B and not csp.constraints(A, a, B, b):
-                    violations.append((A, B))
-                    # Κατηγοριοποίηση παραβίασης
-                    if A.endswith('_Lab') or B.endswith('_Lab'):
-                        lab_seq += 1
-                    elif csp.course_info[A]['semester'] == csp.course_info[B]['semester']:
-                        same_day += 1
-                    elif csp.course_info[A]['is_difficult'] and csp.course_info[B]['is_difficult']:
-                        difficult += 1
-                    elif csp.course_info[A]['instructor'] == csp.course_info[B]['instructor']:
-                        instructor += 1
+        # Ανάλυση παραβιάσεων περιορισμών ανά τύπο (διανυσματικά, μία κλάση ανά ζεύγος)
+        by_class = find_violations(solution, csp)
+        violations = [pair for name in VIOLATION_CLASSES for pair in by_class[name]]
 
         days_used = len(set(day for day, _ in solution.values()))
         slots_used = len(set((day, slot) for day, slot in solution.values()))
@@ -324,26 +630,28 @@ def compare_algorithms(courses):
             'time': time.time() - start_time,
             'num_variables': len(csp.variables),
             'num_assigned': len(solution),
-            'constraints_checked': csp.constraint_weights.copy(),
+            'constraints_checked': csp.weight_table(),
             'violations': violations,
             'schedule': format_solution(solution),
             'days_used': days_used,
             'slots_used': slots_used,
-            'lab_sequencing_violations': lab_seq,
-            'same_day_violations': same_day,
-            'difficult_course_violations': difficult,
-            'instructor_violations': instructor
+            'lab_sequencing_violations': len(by_class['lab_order']),
+            'same_day_violations': len(by_class['same_semester']),
+            'difficult_course_violations': len(by_class['difficult_spacing']),
+            'instructor_violations': len(by_class['instructor']),
+            'slot_clash_violations': len(by_class['slot_clash'])
         }
 
     # Δοκιμή Forward Checking
     start = time.time()
-    fc_solution = schedule_exams_fc(courses)
-    results['Forward Checking'] = collect_metrics('Forward Checking', fc_solution, ExamSchedulerCSP(courses), start)
+    # Τα βάρη dom/wdeg διαβάζονται από το csp που χρησιμοποίησε η αναζήτηση
+    fc_solution, fc_csp = schedule_exams_fc(courses, return_csp=True)
+    results['Forward Checking'] = collect_metrics('Forward Checking', fc_solution, fc_csp, start)
 
     # Δοκιμή MAC
     start = time.time()
-    mac_solution = schedule_exams_mac(courses)
-    results['MAC'] = collect_metrics('MAC', mac_solution, ExamSchedulerCSP(courses), start)
+    mac_solution, mac_csp = schedule_exams_mac(courses, return_csp=True)
+    results['MAC'] = collect_metrics('MAC', mac_solution, mac_csp, start)
 
     # Δοκιμή MinConflicts
     start = time.time()
@@ -352,6 +660,78 @@ def compare_algorithms(courses):
 
     return results
 
+def portfolio_configurations(seeds=3):
+    """
+    Ρυθμίσεις του χαρτοφυλακίου: (όνομα, επιλυτής, παράμετροι). Το FC-CBJ δεν
+    περιλαμβάνεται: εξερευνά σχεδόν τους ίδιους κόμβους με το απλό FC, ενώ το FC
+    με επανεκκινήσεις βρίσκει λύση πολύ νωρίτερα.
+    """
+    configs = [
+        ('Forward Checking', schedule_exams_fc, {}),
+        ('MAC', schedule_exams_mac, {}),
+    ]
+    for seed in range(seeds):
+        configs.append((f'Forward Checking (seed={seed})', schedule_exams_fc, {'seed': seed}))
+        configs.append((f'MAC (seed={seed})', schedule_exams_mac, {'seed': seed}))
+        configs.append((f'MinConflicts (seed={seed})', schedule_exams_minconflicts, {'seed': seed}))
+    return configs
+
+def _run_configuration(name, solver, courses, kwargs):
+    """Εκτέλεση μίας ρύθμισης σε διεργασία του χαρτοφυλακίου, χωρίς εκτυπώσεις."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        solution = solver(courses, **kwargs)
+    return name, solution
+
+def schedule_exams_portfolio(courses, max_workers=None, seeds=3, timeout=None):
+    """
+    Παράλληλο χαρτοφυλάκιο: οι επιλυτές τρέχουν ταυτόχρονα σε ξεχωριστές διεργασίες
+    και επιστρέφεται η πρώτη επαληθευμένη λύση. Οι υπόλοιπες διεργασίες τερματίζονται,
+    όπως και όλες αν περάσει το χρονικό όριο timeout (δευτερόλεπτα).
+
+    Επιστρέφει:
+        (λύση, όνομα_ρύθμισης) ή (None, None) αν καμία ρύθμιση δεν βρήκε λύση
+    """
+    print("\nΈναρξη παράλληλου χαρτοφυλακίου επιλυτών...")
+    configs = portfolio_configurations(seeds)
+    csp = ExamSchedulerCSP(courses)
+    executor = ProcessPoolExecutor(max_workers=max_workers or len(configs))
+    names = {executor.submit(_run_configuration, name, solver, courses, kwargs): name
+             for name, solver, kwargs in configs}
+    pending = set(names)
+    solution, winner = None, None
+    deadline = None if timeout is None else time.time() + timeout
+    try:
+        while pending and winner is None:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                # Μια ρύθμιση που απέτυχε με εξαίρεση δεν σταματά τις υπόλοιπες
+                try:
+                    name, candidate = future.result()
+                except Exception as error:
+                    print(f"Χαρτοφυλάκιο: η ρύθμιση {names[future]} απέτυχε ({error!r})")
+                    continue
+                if candidate and verify_solution(candidate, csp):
+                    solution, winner = candidate, name
+                    break
+    finally:
+        # Ακύρωση όσων δεν ξεκίνησαν και τερματισμός όσων εκτελούνται ακόμα. Το
+        # ProcessPoolExecutor δεν δίνει δημόσιο τρόπο τερματισμού εργασιών που τρέχουν,
+        # οπότε οι διεργασίες διαβάζονται από το ιδιωτικό _processes (λεπτομέρεια του CPython).
+        processes = list(executor._processes.values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    if winner:
+        print(f"Χαρτοφυλάκιο: νικήτρια ρύθμιση {winner}")
+    else:
+        print("Χαρτοφυλάκιο: καμία ρύθμιση δεν βρήκε λύση")
+    return solution, winner
+
 if __name__ == '__main__':
     # Φόρτωση μαθημάτων από CSV
     import csv
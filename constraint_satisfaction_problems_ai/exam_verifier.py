@@ -0,0 +1,128 @@
+"""
+Διανυσματικός Έλεγχος Λύσεων Χρονοπρογραμματισμού Εξετάσεων
+
+Η ανάθεση κωδικοποιείται σε πίνακες NumPy (κωδικός τιμής, ημέρα, πλάτος, εξάμηνο,
+καθηγητής, δυσκολία, θεωρία κάθε εργαστηρίου) και κάθε κλάση παραβιάσεων
+υπολογίζεται χωρίς διπλό βρόχο σε Python:
+- Συγκρούσεις ίδιας χρονοθυρίδας, ίδιου εξαμήνου και ίδιου καθηγητή: ομαδοποίηση
+  με ταξινόμηση κατά κλειδί (π.χ. εξάμηνο και ημέρα). Ζεύγη παράγονται μόνο για
+  ομάδες με περισσότερα από ένα μέλη, οπότε μια έγκυρη λύση ελέγχεται σε O(n log n).
+- Απόσταση δύσκολων μαθημάτων: broadcasting πάνω στο υποσύνολο των δύσκολων.
+- Σειρά θεωρίας-εργαστηρίου και σειρά του σπασίματος συμμετρίας: ένας έλεγχος ανά ζεύγος.
+Κάθε ζεύγος που παραβιάζει περιορισμούς καταγράφεται μία φορά, στην πρώτη κλάση
+του VIOLATION_CLASSES που παραβιάζει.
+
+Δέχεται τόσο λύσεις με ξεχωριστές εξετάσεις εργαστηρίου όσο και λύσεις με
+σύνθετες μεταβλητές θεωρίας-εργαστηρίου (πλάτους 2).
+"""
+import numpy as np
+
+from exam_model import VALUE_CODE, DAY
+
+# Κλάσεις παραβιάσεων με σειρά προτεραιότητας κατηγοριοποίησης
+VIOLATION_CLASSES = ('lab_order', 'same_semester', 'difficult_spacing', 'instructor',
+                     'slot_clash', 'symmetry_order')
+
+def _codes(labels):
+    """Ακέραιοι κωδικοί για τις (πιθανώς συμβολοσειρές) ετικέτες."""
+    return np.unique(np.asarray(labels), return_inverse=True)[1]
+
+def _group_pairs(keys, members):
+    """Όλα τα ζεύγη (i, j) των members με ίδιο κλειδί, χωρίς βρόχο ανά ομάδα."""
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    members = members[order]
+    m = len(keys)
+    # Τέλος της ομάδας κάθε θέσης: κάθε μέλος ζευγαρώνει με τα επόμενα της ομάδας του
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if m else np.empty(0, dtype=np.intp)
+    sizes = np.diff(np.r_[starts, m])
+    ends = np.repeat(starts + sizes, sizes)
+    counts = ends - 1 - np.arange(m)
+    left = np.repeat(np.arange(m), counts)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = left + 1 + offsets
+    return np.stack([members[left], members[right]], axis=1)
+
+def find_violations(solution, csp):
+    """
+    Παραβιάσεις περιορισμών μιας (πλήρους ή μερικής) λύσης.
+
+    Παράμετροι:
+        solution: Λεξικό μεταβλητή -> (ημέρα, χρονοθυρίδα)
+        csp: Το ExamSchedulerCSP του προβλήματος
+
+    Επιστρέφει:
+        Λεξικό κλάση -> λίστα ζευγών (A, B) με A < B, για κάθε κλάση του VIOLATION_CLASSES
+    """
+    names = list(solution)
+    n = len(names)
+    index = {name: k for k, name in enumerate(names)}
+    info = [csp.course_info[name] for name in names]
+
+    code = np.array([VALUE_CODE[solution[name]] for name in names], dtype=np.intp)
+    day = np.asarray(DAY, dtype=np.intp)[code] if n else np.empty(0, dtype=np.intp)
+    semester = np.array([course['semester'] for course in info], dtype=np.intp)
+    instructor = _codes([course['instructor'] for course in info]) if n else np.empty(0, dtype=np.intp)
+    difficult = np.array([course['is_difficult'] for course in info], dtype=bool)
+
+    # Θεωρία κάθε ξεχωριστού εργαστηρίου (-1 για τα υπόλοιπα). Μια θεωρία χωρίς
+    # ξεχωριστό εργαστήριο στη λύση είναι σύνθετη μεταβλητή πλάτους 2.
+    theory_of = {lab: theory for theory, lab in csp.lab_pairs.items()}
+    parent = np.array([index.get(theory_of.get(name), -1) for name in names], dtype=np.intp)
+    is_lab = np.array([name in theory_of for name in names], dtype=bool)
+    width = np.array([2 if name in csp.merged_labs and csp.lab_pairs[name] not in index else 1
+                      for name in names], dtype=np.intp)
+
+    candidates = {}
+
+    # Θεωρία-εργαστήριο: το εργαστήριο στην επόμενη χρονοθυρίδα της ίδιας ημέρας
+    labs = np.flatnonzero(parent >= 0)
+    theories = parent[labs]
+    wrong = (code[labs] != code[theories] + 1) | (day[labs] != day[theories])
+    candidates['lab_order'] = np.stack([theories[wrong], labs[wrong]], axis=1)
+
+    # Ίδιο εξάμηνο / ίδιος καθηγητής την ίδια ημέρα (τα εργαστήρια εξαιρούνται)
+    courses = np.flatnonzero(~is_lab)
+    candidates['same_semester'] = _group_pairs(semester[courses] * 64 + day[courses], courses)
+    candidates['instructor'] = _group_pairs(instructor[courses] * 64 + day[courses], courses)
+
+    # Δύσκολα μαθήματα με απόσταση μικρότερη από 2 ημέρες
+    hard = np.flatnonzero(difficult & ~is_lab)
+    close = np.abs(day[hard][:, None] - day[hard][None, :]) < 2
+    first, second = np.nonzero(np.triu(close, 1))
+    candidates['difficult_spacing'] = np.stack([hard[first], hard[second]], axis=1)
+
+    # Ίδια χρονοθυρίδα: κάθε εξέταση καταλαμβάνει τις χρονοθυρίδες code .. code + width - 1
+    wide = np.flatnonzero(width > 1)
+    cells = np.concatenate([code, code[wide] + 1])
+    owners = np.concatenate([np.arange(n, dtype=np.intp), wide])
+    candidates['slot_clash'] = _group_pairs(cells, owners)
+
+    # Αύξουσα σειρά τιμών μεταξύ εναλλάξιμων μαθημάτων (σπάσιμο συμμετρίας)
+    variables = csp.model.variables
+    ordered = [(index[variables[i]], index[variables[j]]) for i, j in csp.model.precedence
+               if variables[i] in index and variables[j] in index]
+    ordered = np.array(ordered, dtype=np.intp).reshape(-1, 2)
+    wrong = code[ordered[:, 0]] >= code[ordered[:, 1]]
+    candidates['symmetry_order'] = ordered[wrong]
+
+    # Κάθε ζεύγος μία φορά, στην πρώτη κλάση που παραβιάζει
+    pairs = np.concatenate([candidates[name] for name in VIOLATION_CLASSES]).reshape(-1, 2)
+    rank = np.concatenate([np.full(len(candidates[name]), k, dtype=np.intp)
+                           for k, name in enumerate(VIOLATION_CLASSES)])
+    low = np.minimum(pairs[:, 0], pairs[:, 1])
+    high = np.maximum(pairs[:, 0], pairs[:, 1])
+    key = low * n + high
+    order = np.lexsort((rank, key))
+    keep = order[np.r_[True, key[order][1:] != key[order][:-1]]] if len(order) else order
+
+    # Ζεύγη (A, B) με A < B κατά όνομα, όπως στον έλεγχο ανά ζεύγος
+    labels = np.array(names, dtype=object)
+    name_rank = np.empty(n, dtype=np.intp)
+    name_rank[np.argsort(labels)] = np.arange(n)
+    low, high, rank = low[keep], high[keep], rank[keep]
+    swap = name_rank[low] > name_rank[high]
+    first = np.where(swap, high, low)
+    second = np.where(swap, low, high)
+    return {name: list(zip(labels[first[rank == k]].tolist(), labels[second[rank == k]].tolist()))
+            for k, name in enumerate(VIOLATION_CLASSES)}
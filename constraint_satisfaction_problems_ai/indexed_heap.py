@@ -0,0 +1,84 @@
+"""
+Δυαδικός Σωρός Ελαχίστων με Δείκτες (indexed min-heap)
+
+Κάθε στοιχείο εμφανίζεται το πολύ μία φορά και η θέση του στον σωρό είναι
+γνωστή, οπότε η αλλαγή κλειδιού και η αφαίρεση οποιουδήποτε στοιχείου
+κοστίζουν O(log n), ενώ η ανάγνωση του ελάχιστου O(1).
+"""
+
+class IndexedHeap:
+    """Σωρός ελαχίστων με ενημέρωση κλειδιού και αφαίρεση κατά στοιχείο."""
+
+    def __init__(self):
+        self.heap = []       # Λίστα από [κλειδί, στοιχείο]
+        self.position = {}   # στοιχείο -> θέση στη λίστα
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def peek(self):
+        """Το στοιχείο με το μικρότερο κλειδί, ή None αν ο σωρός είναι άδειος."""
+        return self.heap[0][1] if self.heap else None
+
+    def push(self, item, key):
+        """Εισαγωγή στοιχείου ή ενημέρωση του κλειδιού του αν υπάρχει ήδη."""
+        if item in self.position:
+            self.update(item, key)
+            return
+        self.heap.append([key, item])
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def update(self, item, key):
+        """Αλλαγή του κλειδιού ενός στοιχείου που υπάρχει στον σωρό."""
+        k = self.position[item]
+        old = self.heap[k][0]
+        self.heap[k][0] = key
+        if key < old:
+            self._sift_up(k)
+        else:
+            self._sift_down(k)
+
+    def discard(self, item):
+        """Αφαίρεση στοιχείου, αν υπάρχει."""
+        k = self.position.pop(item, None)
+        if k is None:
+            return
+        last = self.heap.pop()
+        if k < len(self.heap):
+            self.heap[k] = last
+            self.position[last[1]] = k
+            self._sift_up(k)
+            self._sift_down(self.position[last[1]])
+
+    def _swap(self, a, b):
+        heap = self.heap
+        heap[a], heap[b] = heap[b], heap[a]
+        self.position[heap[a][1]] = a
+        self.position[heap[b][1]] = b
+
+    def _sift_up(self, k):
+        heap = self.heap
+        while k > 0:
+            parent = (k - 1) // 2
+            if heap[k][0] < heap[parent][0]:
+                self._swap(k, parent)
+                k = parent
+            else:
+                break
+
+    def _sift_down(self, k):
+        heap = self.heap
+        n = len(heap)
+        while True:
+            smallest = k
+            for child in (2 * k + 1, 2 * k + 2):
+                if child < n and heap[child][0] < heap[smallest][0]:
+                    smallest = child
+            if smallest == k:
+                break
+            self._swap(k, smallest)
+            k = smallest
@@ -1,4 +1,6 @@
+import sys
 import time
+import random
 import pandas as pd
 import numpy as np
 from exam_scheduler import *
@@ -33,11 +35,79 @@ def analyze_results(df):
         'Μέσος Αριθμός Παραβιάσεων Εργαστηρίων': grouped['lab_sequencing_violations'].mean(),
         'Μέσος Αριθμός Παραβιάσεων Ίδιας Ημέρας': grouped['same_day_violations'].mean(),
         'Μέσος Αριθμός Παραβιάσεων Δύσκολων Μαθημάτων': grouped['difficult_course_violations'].mean(),
-        'Μέσος Αριθμός Παραβιάσεων Καθηγητών': grouped['instructor_violations'].mean()
+        'Μέσος Αριθμός Παραβιάσεων Καθηγητών': grouped['instructor_violations'].mean(),
+        'Μέσος Αριθμός Συγκρούσεων Χρονοθυρίδας': grouped['slot_clash_violations'].mean()
     })
 
     return stats.round(2)
 
+def synthetic_catalog(num_courses, seed=0, semesters=4, instructors=5,
+                      difficult_prob=0.15, lab_prob=0.3):
+    """Συνθετικός κατάλογος μαθημάτων με τις στήλες του h3-data.csv."""
+    rng = random.Random(seed)
+    courses = []
+    for k in range(num_courses):
+        courses.append({
+            'Μάθημα': f'Μάθημα {k:03d}',
+            'Εξάμηνο': rng.randint(1, semesters),
+            'Καθηγητής': f'Καθηγητής {rng.randrange(instructors)}',
+            'Δύσκολο (TRUE/FALSE)': 'TRUE' if rng.random() < difficult_prob else 'FALSE',
+            'Εργαστήριο (TRUE/FALSE)': 'TRUE' if rng.random() < lab_prob else 'FALSE'
+        })
+    return courses
+
+def symmetry_benchmark(catalogs, failure_limit=20000):
+    """
+    Μέγεθος δέντρου αναζήτησης (αριθμός αναθέσεων) του Forward Checking με και χωρίς
+    σπάσιμο συμμετρίας. Κάθε εκτέλεση σταματά μετά από failure_limit αποτυχίες.
+    """
+    rows = []
+    for name, courses in catalogs.items():
+        for symmetry_breaking in (False, True):
+            csp = ExamSchedulerCSP(courses, symmetry_breaking)
+            start = time.time()
+            solution, _ = restarting_search(csp, forward_checking, scale=failure_limit, max_restarts=0)
+            rows.append({
+                'catalog': name,
+                'symmetry_breaking': symmetry_breaking,
+                'ordered_pairs': len(csp.model.precedence),
+                'nodes': csp.nassigns,
+                'solution_found': solution is not None,
+                'time': time.time() - start
+            })
+    return pd.DataFrame(rows)
+
+def exact_backend_benchmark(sizes, seeds=3, max_restarts=20, time_limit=60):
+    """
+    Forward Checking και MAC (με επανεκκινήσεις Luby, το πολύ max_restarts) έναντι του
+    επιλυτή MIP (χρονικό όριο time_limit δευτερόλεπτα) σε συνθετικούς καταλόγους
+    αυξανόμενου μεγέθους.
+    """
+    backends = {
+        'Forward Checking': lambda csp: restarting_search(csp, forward_checking,
+                                                          max_restarts=max_restarts)[0],
+        'MAC': lambda csp: restarting_search(csp, mac_inference, order_domain_values=lcv,
+                                             max_restarts=max_restarts)[0],
+        'MIP': lambda csp: solve_exam_mip(csp, time_limit=time_limit)[0],
+    }
+    rows = []
+    for size in sizes:
+        for seed in range(seeds):
+            courses = synthetic_catalog(size, seed)
+            for name, backend in backends.items():
+                csp = ExamSchedulerCSP(courses)
+                start = time.time()
+                solution = backend(csp)
+                rows.append({
+                    'size': size,
+                    'seed': seed,
+                    'exams': len(csp.variables),
+                    'algorithm': name,
+                    'solution_found': solution is not None,
+                    'time': time.time() - start
+                })
+    return pd.DataFrame(rows)
+
 if __name__ == "__main__":
     # Φόρτωση δεδομένων μαθημάτων με συγκεκριμένους τύπους δεδομένων
     courses = pd.read_csv('~/attachments/h3-data.csv', dtype={
@@ -51,6 +121,20 @@ if __name__ == "__main__":
 
     courses_dict = courses.to_dict('records')
 
+    if '--symmetry' in sys.argv:
+        # Σύγκριση μεγέθους δέντρου αναζήτησης με και χωρίς σπάσιμο συμμετρίας
+        catalogs = {'h3-data.csv': courses_dict}
+        for size in (30, 40, 50, 60):
+            for seed in range(3):
+                catalogs[f'synthetic-{size}-{seed}'] = synthetic_catalog(size, seed)
+        print(symmetry_benchmark(catalogs).to_string())
+        sys.exit(0)
+
+    if '--exact' in sys.argv:
+        # Σύγκριση των FC/MAC με τον ακριβή επιλυτή MIP σε αυξανόμενα μεγέθη
+        print(exact_backend_benchmark((20, 30, 40, 45, 50)).to_string())
+        sys.exit(0)
+
     print("Έναρξη πειραματικής σύγκρισης...")
     print(f"Σύνολο μαθημάτων: {len(courses)}")
     print(f"Δύσκολα μαθήματα: {courses['is_difficult'].sum()}")
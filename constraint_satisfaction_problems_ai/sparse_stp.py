@@ -0,0 +1,120 @@
+"""
+Αραιή Υλοποίηση Απλών Χρονικών Προβλημάτων (Sparse STP)
+
+Συγγραφέας: Στυλιανός Ζαχαριουδάκης
+ΑΜ: 1115202200243
+
+Εναλλακτικό backend του d-graph για μεγάλα και αραιά δίκτυα περιορισμών.
+Αντί για πυκνό πίνακα n×n αποθηκεύονται μόνο οι ακμές του γράφου αποστάσεων:
+- Η συνέπεια ελέγχεται με Bellman-Ford με ουρά (SPFA) από μια εικονική πηγή
+  που συνδέεται με βάρος 0 σε όλα τα γεγονότα.
+- Οι αποστάσεις της πηγής αποτελούν συνάρτηση δυναμικού h, με την οποία τα
+  βάρη γίνονται μη αρνητικά (Johnson) και κάθε γραμμή ή στήλη του ελάχιστου
+  δικτύου υπολογίζεται με Dijkstra μόνο όταν ζητηθεί.
+Η μνήμη είναι O(n + m) αντί για O(n²).
+"""
+from typing import Dict, List, Tuple, Optional
+import heapq
+
+from d_graph_algorithm import Edge, NegativeCycle, spfa, extract_cycle
+
+class SparseSTP:
+    def __init__(self, events: List[str], constraints: List[Tuple[str, str, float]]):
+        """
+        Αρχικοποίηση αραιού STP με γεγονότα και περιορισμούς.
+
+        Παράμετροι:
+            events: Λίστα ονομάτων γεγονότων (το πρώτο είναι το γεγονός αναφοράς)
+            constraints: Λίστα από πλειάδες (από_γεγονός, προς_γεγονός, βάρος),
+                         με την ίδια σημασία xj - xi ≤ βάρος όπως στο DGraph
+        """
+        self.events = events
+        self.event_to_idx = {event: i for i, event in enumerate(events)}
+        n = len(events)
+
+        # Λίστες γειτνίασης προς τα εμπρός και αντίστροφα
+        self.out_edges: List[List[Edge]] = [[] for _ in range(n)]
+        self.in_edges: List[List[Edge]] = [[] for _ in range(n)]
+        for from_event, to_event, weight in constraints:
+            i, j = self.event_to_idx[from_event], self.event_to_idx[to_event]
+            self.out_edges[i].append((j, weight))
+            self.in_edges[j].append((i, weight))
+
+        # Έλεγχος συνέπειας και υπολογισμός δυναμικού με ένα SPFA
+        self.potential, parent, parent_weight, cycle_vertex = spfa(n, self.out_edges)
+        self.is_consistent = cycle_vertex == -1
+        self.negative_cycle = (None if self.is_consistent else
+                               extract_cycle(cycle_vertex, parent, parent_weight, events))
+
+    def _dijkstra(self, source: int, edges: List[List[Edge]], reverse: bool) -> Dict[int, float]:
+        """
+        Dijkstra με βάρη επαναζυγισμένα από το δυναμικό, w' = w + h(u) - h(v) ≥ 0.
+        Επιστρέφει τις πραγματικές αποστάσεις d(source, ·), ή d(·, source) αν reverse.
+        """
+        h = self.potential
+        dist = {source: 0.0}
+        done = set()
+        heap = [(0.0, source)]
+        while heap:
+            du, u = heapq.heappop(heap)
+            if u in done:
+                continue
+            done.add(u)
+            for v, weight in edges[u]:
+                reduced = weight + h[v] - h[u] if reverse else weight + h[u] - h[v]
+                new_dist = du + reduced
+                if new_dist < dist.get(v, float('inf')):
+                    dist[v] = new_dist
+                    heapq.heappush(heap, (new_dist, v))
+
+        # Επαναφορά από τα επαναζυγισμένα μήκη στα πραγματικά
+        if reverse:
+            return {v: dv + h[source] - h[v] for v, dv in dist.items()}
+        return {v: dv - h[source] + h[v] for v, dv in dist.items()}
+
+    def _require_consistent(self):
+        if not self.is_consistent:
+            raise ValueError("Το STP είναι ασυνεπές: το ελάχιστο δίκτυο δεν ορίζεται")
+
+    def minimal_row(self, event: str) -> Dict[str, float]:
+        """Γραμμή d(event, ·) του ελάχιστου δικτύου, μόνο για τα προσβάσιμα γεγονότα."""
+        self._require_consistent()
+        dist = self._dijkstra(self.event_to_idx[event], self.out_edges, reverse=False)
+        return {self.events[j]: d for j, d in dist.items()}
+
+    def minimal_column(self, event: str) -> Dict[str, float]:
+        """Στήλη d(·, event) του ελάχιστου δικτύου, μόνο για τα γεγονότα που το φτάνουν."""
+        self._require_consistent()
+        dist = self._dijkstra(self.event_to_idx[event], self.in_edges, reverse=True)
+        return {self.events[i]: d for i, d in dist.items()}
+
+    def minimal_rows(self, events: List[str]) -> Dict[str, Dict[str, float]]:
+        """Γραμμές του ελάχιστου δικτύου μόνο για τα γεγονότα που ζητούνται."""
+        return {event: self.minimal_row(event) for event in events}
+
+    def earliest_solution(self) -> Dict[str, float]:
+        """
+        Νωρίτερη λύση σε σχέση με το πρώτο γεγονός: x_i = -d(i, αναφορά).
+        Γεγονότα χωρίς κάτω φράγμα ως προς την αναφορά λαμβάνουν -inf, όπως στο DGraph.
+        """
+        column = self.minimal_column(self.events[0])
+        return {event: -column.get(event, float('inf')) for event in self.events}
+
+    def latest_solution(self) -> Dict[str, float]:
+        """
+        Αργότερη λύση σε σχέση με το πρώτο γεγονός: x_i = d(αναφορά, i).
+        Γεγονότα χωρίς άνω φράγμα ως προς την αναφορά λαμβάνουν inf.
+        """
+        row = self.minimal_row(self.events[0])
+        return {event: row.get(event, float('inf')) for event in self.events}
+
+    def compute_d_graph(self) -> Tuple[bool, Dict[str, float], Optional[NegativeCycle]]:
+        """
+        Ίδια διεπαφή με το DGraph.compute_d_graph.
+
+        Επιστρέφει:
+            (είναι_συνεπές, νωρίτερη_λύση, αρνητικός_κύκλος)
+        """
+        if not self.is_consistent:
+            return False, {}, self.negative_cycle
+        return True, self.earliest_solution(), None
@@ -3,7 +3,14 @@
 Βασισμένο στην αφήγηση σχετικά με τη μετακίνηση της Μαρίας και της Ελένης
 """
 from typing import Dict, List, Tuple
-import numpy as np
+
+from d_graph_algorithm import DGraph
+
+def minutes_to_time(minutes: float) -> str:
+    """Μετατροπή λεπτών από τις 8:00 π.μ. σε ώρα ρολογιού."""
+    hours = 8 + minutes // 60
+    mins = minutes % 60
+    return f"{int(hours):02d}:{int(mins):02d}"
 
 class SimpleTemporalProblem:
     def __init__(self):
@@ -12,85 +19,64 @@ class SimpleTemporalProblem:
         Ο χρόνος αναπαρίσταται σε λεπτά από τις 8:00 π.μ.
         """
         # Γεγονότα (μεταβλητές):
+        # X0: Χρονικό σημείο αναφοράς (8:00)
         # ML: Αναχώρηση Μαρίας (μεταξύ 8:00-8:10)
         # MA: Άφιξη Μαρίας
         # EL: Αναχώρηση Ελένης
         # EA: Άφιξη Ελένης (15 λεπτά μετά τη Μαρία)
+        self.events = ['X0', 'ML', 'MA', 'EL', 'EA']
+        self.n_events = len(self.events)
+        self.labels = {
+            'ML': 'Η Μαρία φεύγει',
+            'MA': 'Η Μαρία φτάνει',
+            'EL': 'Η Ελένη φεύγει',
+            'EA': 'Η Ελένη φτάνει'
+        }
 
-        # Initialize distance matrix (d-graph)
-        self.n_events = 4
-        self.events = ['ML', 'MA', 'EL', 'EA']
-        self.d = np.full((self.n_events, self.n_events), float('inf'))
-
-        # Set diagonal to 0
-        np.fill_diagonal(self.d, 0)
-
-        # Add constraints from narrative:
-        # 1. Maria leaves between 8:00 and 8:10
-        self.d[0, 0] = 0    # ML-ML
-        self.d[0, 1] = 40   # ML-MA (max 40 min commute)
-        self.d[1, 0] = -30  # MA-ML (min 30 min commute)
-
-        # 2. Eleni arrives 15 min after Maria
-        self.d[1, 3] = 15   # MA-EA (exactly 15 min)
-        self.d[3, 1] = -15  # EA-MA
-
-        # 3. Eleni's commute takes 5-15 minutes
-        self.d[2, 3] = 15   # EL-EA (max 15 min)
-        self.d[3, 2] = -5   # EA-EL (min 5 min)
+        # Περιορισμοί της αφήγησης (από_γεγονός, προς_γεγονός, βάρος): προς - από ≤ βάρος
+        self.constraints = [
+            # 1. Η Μαρία φεύγει μεταξύ 8:00 και 8:10
+            ('X0', 'ML', 10),
+            ('ML', 'X0', 0),
+            # 2. Η μετακίνηση της Μαρίας διαρκεί 30-40 λεπτά
+            ('ML', 'MA', 40),
+            ('MA', 'ML', -30),
+            # 3. Η Ελένη φτάνει ακριβώς 15 λεπτά μετά τη Μαρία
+            ('MA', 'EA', 15),
+            ('EA', 'MA', -15),
+            # 4. Η μετακίνηση της Ελένης διαρκεί 5-15 λεπτά
+            ('EL', 'EA', 15),
+            ('EA', 'EL', -5)
+        ]
+
+        # Το ελάχιστο δίκτυο υπολογίζεται από την κοινή μηχανή STP
+        self.d_graph = DGraph(self.events, self.constraints)
+        self.d = self.d_graph.d
 
     def floyd_warshall(self) -> bool:
         """
-        Εφαρμογή του αλγορίθμου Floyd-Warshall για τον υπολογισμό συντομότερων διαδρομών.
         Επιστρέφει True αν το STP είναι συνεπές (χωρίς αρνητικούς κύκλους).
+        Η διάδοση Floyd-Warshall έχει ήδη γίνει από το DGraph.
         """
-        n = self.n_events
-
-        # Floyd-Warshall algorithm
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if self.d[i,k] != float('inf') and self.d[k,j] != float('inf'):
-                        self.d[i,j] = min(self.d[i,j], self.d[i,k] + self.d[k,j])
+        return self.d_graph.find_negative_cycle() is None
 
-        # Check for negative cycles
-        for i in range(n):
-            if self.d[i,i] < 0:
-                return False
-        return True
+    def time_window(self, event: str) -> Tuple[float, float]:
+        """Νωρίτερος και αργότερος χρόνος του γεγονότος από το ελάχιστο δίκτυο."""
+        idx = self.d_graph.event_to_idx[event]
+        return -self.d[idx, 0], self.d[0, idx]
 
     def generate_solutions(self) -> List[Dict[str, str]]:
         """
-        Δημιουργία δύο έγκυρων λύσεων για το χρονικό πρόβλημα.
+        Δημιουργία δύο έγκυρων λύσεων από το ελάχιστο δίκτυο: τη νωρίτερη
+        (κάθε γεγονός στο κάτω όριό του) και την αργότερη (στο άνω όριό του).
         Οι χρόνοι μετατρέπονται σε ώρες ρολογιού για ευκολότερη ανάγνωση.
         """
-        def minutes_to_time(minutes: float) -> str:
-            """Μετατροπή λεπτών από τις 8:00 π.μ. σε ώρα ρολογιού."""
-            hours = 8 + minutes // 60
-            mins = minutes % 60
-            return f"{int(hours):02d}:{int(mins):02d}"
-
-        solutions = []
-
-        # Λύση 1: Η Μαρία φεύγει στις 8:00
-        sol1 = {
-            'Η Μαρία φεύγει': minutes_to_time(0),      # 8:00
-            'Η Μαρία φτάνει': minutes_to_time(35),    # 8:35
-            'Η Ελένη φεύγει': minutes_to_time(45),     # 8:45
-            'Η Ελένη φτάνει': minutes_to_time(50)     # 8:50
-        }
-        solutions.append(sol1)
-
-        # Λύση 2: Η Μαρία φεύγει στις 8:05
-        sol2 = {
-            'Η Μαρία φεύγει': minutes_to_time(5),      # 8:05
-            'Η Μαρία φτάνει': minutes_to_time(40),    # 8:40
-            'Η Ελένη φεύγει': minutes_to_time(50),     # 8:50
-            'Η Ελένη φτάνει': minutes_to_time(55)     # 8:55
-        }
-        solutions.append(sol2)
-
-        return solutions
+        windows = {event: self.time_window(event) for event in self.labels}
+        earliest = {self.labels[event]: minutes_to_time(low)
+                    for event, (low, _) in windows.items()}
+        latest = {self.labels[event]: minutes_to_time(high)
+                  for event, (_, high) in windows.items()}
+        return [earliest, latest]
 
     def analyze_problem(self) -> str:
         """
@@ -129,12 +115,13 @@ class SimpleTemporalProblem:
                 for event, time in sol.items():
                     analysis += f"\n   - {event}: {time}"
 
-            analysis += """
+            el_earliest, el_latest = (minutes_to_time(t) for t in self.time_window('EL'))
+            analysis += f"""
 
 5. Απάντηση στην Ερώτηση:
    Πότε έφυγε η Ελένη από το σπίτι της;
    Με βάση τη διάδοση περιορισμών:
-   - Η Ελένη πρέπει να έφυγε μεταξύ 8:45 και 8:50
+   - Η Ελένη πρέπει να έφυγε μεταξύ {el_earliest} και {el_latest}
    - Αυτό εξασφαλίζει τη διάρκεια μετακίνησης 5-15 λεπτών
    - Επιτρέπει την άφιξή της ακριβώς 15 λεπτά μετά τη Μαρία
    - Ικανοποιεί όλους τους χρονικούς περιορισμούς"""